@@ -154,31 +154,32 @@ def get_agent_client(provider: Optional[str] = None) -> AIClient:
     Raises:
         ValueError: If provider not found or not configured
     """
+    # Registry hit: repeat calls for the same provider skip the config
+    # load and client construction (TLS context etc.) entirely
+    if provider and provider in _client_registry:
+        return _client_registry[provider]
+
     from cli.config import load_config
-    
+
     config = load_config()
-    
+
     # Use first available provider if none specified
     if not provider:
         for p in config.ai_providers:
             if p.enabled and p.api_key:
                 provider = p.name
                 break
-    
+
     if not provider:
         raise ValueError("No AI provider configured")
-    
+
     # Check if client is already registered
     if provider in _client_registry:
         return _client_registry[provider]
-    
+
     # Get provider config
-    provider_config = None
-    for p in config.ai_providers:
-        if p.name == provider:
-            provider_config = p
-            break
-    
+    provider_config = config.provider_by_name(provider)
+
     if not provider_config or not provider_config.api_key:
         raise ValueError(f"Provider '{provider}' not configured")
     
@@ -59,6 +59,63 @@ class LogAnalyzer(BaseAgent):
         else:
             raise RuntimeError(f"Log analysis failed: {response.error}")
     
+    def analyze_stream(
+        self,
+        line_iter,
+        log_type: str = "android",
+        severity_filter: Optional[str] = None,
+        context: Optional[Dict[str, Any]] = None,
+        temperature: float = 0.3
+    ) -> str:
+        """Analyze logs from a file-like object or line iterator.
+
+        Streams the input instead of materializing the full text, keeping
+        only the bounded tail window that analysis uses anyway. Peak memory
+        stays constant regardless of log file size.
+
+        Args:
+            line_iter: File handle or iterable of log lines
+            log_type: Type of logs (android, system, application)
+            severity_filter: Filter by severity level
+            context: Additional context information
+            temperature: Sampling temperature
+
+        Returns:
+            Analysis results and recommendations
+        """
+        from collections import deque
+
+        level_pattern = re.compile(r'\d{2}-\d{2}\s+\d{2}:\d{2}:\d{2}\.\d{3}\s+\d+\s+\d+\s+([VDIWEF])')
+
+        allowed_levels = None
+        if severity_filter:
+            severity_map = {
+                "error": ["E", "F"],
+                "warning": ["W", "E", "F"],
+                "info": ["I", "W", "E", "F"],
+                "debug": ["D", "I", "W", "E", "F"],
+                "verbose": ["V", "D", "I", "W", "E", "F"]
+            }
+            allowed_levels = severity_map.get(severity_filter.lower(), ["E", "F"])
+
+        # Keep only the most recent entries, same window as _preprocess_logs
+        window = deque(maxlen=500)
+        for line in line_iter:
+            line = line.rstrip('\n')
+            if allowed_levels is not None:
+                match = level_pattern.match(line)
+                # Non-standard format lines are kept, matching _preprocess_logs
+                if match and match.group(1) not in allowed_levels:
+                    continue
+            window.append(line)
+
+        return self.analyze(
+            '\n'.join(window),
+            log_type=log_type,
+            context=context,
+            temperature=temperature
+        )
+
     def _load_crash_patterns(self) -> List[Dict[str, str]]:
         """Load common crash patterns for detection."""
         return [
@@ -8,7 +8,9 @@ from dataclasses import dataclass
 from pathlib import Path
 import time
 
-@dataclass
+from .adb_client import AdbClient, AdbShellDispatchedError
+
+@dataclass(slots=True)
 class CommandResult:
     """Result of executing a command."""
     success: bool
@@ -16,7 +18,7 @@ class CommandResult:
     error: str
     exit_code: int
 
-@dataclass  
+@dataclass(slots=True)
 class AndroidDevice:
     """Android device information."""
     id: str
@@ -35,6 +37,7 @@ class ADBManager:
             adb_path: Custom path to adb binary
         """
         self.adb_path = adb_path or "adb"
+        self._client = AdbClient()
         self._check_adb_available()
     
     def _check_adb_available(self) -> bool:
@@ -66,13 +69,41 @@ class ADBManager:
         Returns:
             CommandResult with execution details
         """
+        # Fast path: short shell commands go straight to the adb server
+        # socket via the shell,v2 service, skipping a fork+exec per call.
+        # shell,v2 carries the device-side exit status, so success here
+        # means the same as on the binary path. Only errors raised before
+        # the command reaches the device fall back to the binary.
+        if args and args[0] == "shell" and len(args) > 1:
+            try:
+                stdout, stderr, exit_code = self._client.shell_v2(
+                    " ".join(args[1:]), device_id, timeout=timeout
+                )
+                return CommandResult(
+                    success=exit_code == 0,
+                    output=stdout.strip(),
+                    error=stderr.strip(),
+                    exit_code=exit_code
+                )
+            except AdbShellDispatchedError as e:
+                # The command may have run (fully or partially); re-running
+                # it through the binary could apply side effects twice
+                return CommandResult(
+                    success=False,
+                    output="",
+                    error=str(e),
+                    exit_code=-1
+                )
+            except (OSError, RuntimeError):
+                pass
+
         cmd = [self.adb_path]
-        
+
         if device_id:
             cmd.extend(["-s", device_id])
-            
+
         cmd.extend(args)
-        
+
         try:
             result = subprocess.run(
                 cmd,
@@ -115,9 +146,8 @@ class ADBManager:
             return []
         
         devices = []
-        lines = result.output.split('\n')[1:]  # Skip header
-        
-        for line in lines:
+
+        for line in result.output.splitlines()[1:]:  # Skip header
             if not line.strip():
                 continue
                 
@@ -317,10 +347,13 @@ class ADBManager:
             True if device is ready, False if timeout
         """
         start_time = time.time()
-        
+
+        # Exponential backoff: fast detection when the device comes up
+        # quickly, few polls when it's slow
+        delay = 0.05
         while time.time() - start_time < timeout:
             devices = self.list_devices()
-            
+
             if device_id:
                 for device in devices:
                     if device.id == device_id and device.status == "device":
@@ -328,9 +361,10 @@ class ADBManager:
             else:
                 if devices and any(d.status == "device" for d in devices):
                     return True
-            
-            time.sleep(2)
-        
+
+            time.sleep(delay)
+            delay = min(delay * 1.5, 1.0)
+
         return False
     
     def get_packages(
@@ -360,7 +394,7 @@ class ADBManager:
             return []
         
         packages = []
-        for line in result.output.split('\n'):
+        for line in result.output.splitlines():
             if line.startswith("package:"):
                 package_name = line.replace("package:", "").strip()
                 packages.append(package_name)
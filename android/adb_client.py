@@ -0,0 +1,227 @@
+"""Minimal client for the local adb server's TCP protocol.
+
+Talking to the adb server socket directly (default 127.0.0.1:5037) avoids a
+fork+exec of the adb binary for every short command, which dominates the cost
+of operations like listing devices or running quick shell one-liners.
+"""
+
+import socket
+import time
+from typing import List, Optional, Tuple
+
+# shell,v2 packet ids (adb's shell_protocol.h)
+_V2_STDOUT = 1
+_V2_STDERR = 2
+_V2_EXIT = 3
+
+class AdbShellDispatchedError(RuntimeError):
+    """Shell command failed after it was already dispatched to the device.
+
+    The command may have executed (fully or partially), so callers must
+    treat this as command failure rather than transparently retrying it
+    through another path.
+    """
+
+class AdbClient:
+    """Persistent-connection client for the adb server socket protocol."""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 5037):
+        """Initialize adb server client.
+
+        Args:
+            host: adb server host
+            port: adb server port (default 5037)
+        """
+        self.host = host
+        self.port = port
+
+    def _connect(self, timeout: Optional[float] = None) -> socket.socket:
+        """Open a connection to the adb server."""
+        sock = socket.create_connection((self.host, self.port), timeout=timeout)
+        return sock
+
+    def _send_request(self, sock: socket.socket, request: str) -> None:
+        """Send a length-prefixed request and check the server's status."""
+        payload = request.encode()
+        sock.sendall(f"{len(payload):04x}".encode() + payload)
+
+        status = self._recv_exact(sock, 4)
+        if status != b"OKAY":
+            message = "unknown adb server error"
+            try:
+                message = self._read_reply(sock)
+            except Exception:
+                pass
+            raise RuntimeError(f"adb server rejected '{request}': {message}")
+
+    def _recv_exact(
+        self,
+        sock: socket.socket,
+        length: int,
+        deadline: Optional[float] = None
+    ) -> bytes:
+        """Read exactly length bytes from the socket.
+
+        With a deadline (time.monotonic() based), the remaining budget is
+        re-applied as the socket timeout before every recv, bounding the
+        whole read end-to-end instead of per-chunk.
+        """
+        data = b""
+        while len(data) < length:
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutError("adb command deadline exceeded")
+                sock.settimeout(remaining)
+            chunk = sock.recv(length - len(data))
+            if not chunk:
+                raise RuntimeError("adb server closed the connection")
+            data += chunk
+        return data
+
+    def _read_reply(self, sock: socket.socket) -> str:
+        """Read a length-prefixed reply payload."""
+        length = int(self._recv_exact(sock, 4), 16)
+        return self._recv_exact(sock, length).decode(errors="replace")
+
+    def _read_shell_v2(
+        self,
+        sock: socket.socket,
+        deadline: Optional[float] = None
+    ) -> Tuple[str, str, int]:
+        """Demultiplex a shell,v2 stream into (stdout, stderr, exit_code).
+
+        Each packet is a 1-byte id plus a 4-byte little-endian payload
+        length. The stream ends with an exit packet carrying the device-side
+        exit status; a connection closed before that packet is an error.
+        The deadline spans the whole stream, so a command trickling output
+        can't run unboundedly past the caller's timeout.
+        """
+        stdout = bytearray()
+        stderr = bytearray()
+        while True:
+            header = self._recv_exact(sock, 5, deadline)
+            packet_id = header[0]
+            length = int.from_bytes(header[1:5], "little")
+            payload = self._recv_exact(sock, length, deadline) if length else b""
+
+            if packet_id == _V2_STDOUT:
+                stdout += payload
+            elif packet_id == _V2_STDERR:
+                stderr += payload
+            elif packet_id == _V2_EXIT:
+                exit_code = payload[0] if payload else 0
+                return (
+                    stdout.decode(errors="replace"),
+                    stderr.decode(errors="replace"),
+                    exit_code,
+                )
+            # Other packet ids (stdin/window-size) are ignored
+
+    def _read_to_eof(self, sock: socket.socket) -> str:
+        """Read raw output until the server closes the stream."""
+        chunks = []
+        while True:
+            chunk = sock.recv(65536)
+            if not chunk:
+                break
+            chunks.append(chunk)
+        return b"".join(chunks).decode(errors="replace")
+
+    def version(self) -> str:
+        """Get the adb server protocol version."""
+        with self._connect(timeout=5) as sock:
+            self._send_request(sock, "host:version")
+            return self._read_reply(sock)
+
+    def devices(self, long_format: bool = False) -> List[Tuple[str, str]]:
+        """List connected devices without forking the adb binary.
+
+        Args:
+            long_format: Include the extended device description
+
+        Returns:
+            List of (serial, state-or-description) tuples
+        """
+        request = "host:devices-l" if long_format else "host:devices"
+
+        with self._connect(timeout=5) as sock:
+            self._send_request(sock, request)
+            reply = self._read_reply(sock)
+
+        devices = []
+        for line in reply.splitlines():
+            if not line.strip():
+                continue
+            parts = line.split(None, 1)
+            if len(parts) == 2:
+                devices.append((parts[0], parts[1].strip()))
+        return devices
+
+    def shell(
+        self,
+        command: str,
+        device_id: Optional[str] = None,
+        timeout: Optional[float] = 30
+    ) -> str:
+        """Run a shell command on the device via the adb server socket.
+
+        Note: the shell service streams combined output only; exit codes are
+        not reported, so callers needing failure detection should inspect the
+        output (or use the adb binary).
+
+        Args:
+            command: Shell command to execute
+            device_id: Target device serial (any device if omitted)
+            timeout: Socket timeout in seconds
+
+        Returns:
+            Command output
+        """
+        transport = f"host:transport:{device_id}" if device_id else "host:transport-any"
+
+        with self._connect(timeout=timeout) as sock:
+            self._send_request(sock, transport)
+            self._send_request(sock, f"shell:{command}")
+            return self._read_to_eof(sock)
+
+    def shell_v2(
+        self,
+        command: str,
+        device_id: Optional[str] = None,
+        timeout: Optional[float] = 30
+    ) -> Tuple[str, str, int]:
+        """Run a shell command via the shell,v2 service.
+
+        Unlike the legacy shell service, shell,v2 frames stdout and stderr
+        separately and reports the device-side exit status. The server
+        rejects the request when the device doesn't support the protocol
+        (pre-API 24), which surfaces as RuntimeError. Failures before the
+        shell request is acknowledged mean the command never ran and are
+        safe to retry elsewhere; anything after that is raised as
+        AdbShellDispatchedError because the command may have executed.
+
+        Args:
+            command: Shell command to execute
+            device_id: Target device serial (any device if omitted)
+            timeout: Overall deadline in seconds for the whole command
+
+        Returns:
+            (stdout, stderr, exit_code) tuple
+        """
+        transport = f"host:transport:{device_id}" if device_id else "host:transport-any"
+        deadline = (time.monotonic() + timeout) if timeout is not None else None
+
+        with self._connect(timeout=timeout) as sock:
+            self._send_request(sock, transport)
+            self._send_request(sock, f"shell,v2:{command}")
+            # Past this point the device has the command; don't let the
+            # error types a caller might retry on leak through
+            try:
+                return self._read_shell_v2(sock, deadline)
+            except AdbShellDispatchedError:
+                raise
+            except (OSError, RuntimeError) as e:
+                raise AdbShellDispatchedError(
+                    f"shell command failed after dispatch: {e}"
+                ) from e
@@ -1,7 +1,10 @@
 """Android device management and automation."""
 
 import json
+import re
+import shlex
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Optional, Any
 from dataclasses import dataclass, asdict
 from pathlib import Path
@@ -9,7 +12,10 @@ from pathlib import Path
 from .adb import ADBManager, AndroidDevice
 from .fastboot import FastbootManager, FastbootDevice
 
-@dataclass
+# Matches the battery "level: NN" line but not "USB level" style variants
+_BATT_LEVEL = re.compile(r'^\s*level:\s*(\d+)', re.MULTILINE)
+
+@dataclass(slots=True)
 class DeviceCapabilities:
     """Device capabilities and features."""
     root_access: bool = False
@@ -19,7 +25,7 @@ class DeviceCapabilities:
     wireless_debugging: bool = False
     developer_options: bool = False
 
-@dataclass
+@dataclass(slots=True)
 class ExtendedDeviceInfo:
     """Extended device information."""
     basic_info: AndroidDevice
@@ -109,7 +115,7 @@ class DeviceManager:
         if cache_key in self._device_cache:
             return self._device_cache[cache_key]
         
-        capabilities = self._detect_capabilities(device.id)
+        capabilities = self._detect_capabilities(device.id, api_level=device.api_level)
         
         # Get additional device properties
         battery_level = self._get_battery_level(device.id)
@@ -132,68 +138,81 @@ class DeviceManager:
         self._device_cache[cache_key] = extended_info
         return extended_info
     
-    def _detect_capabilities(self, device_id: str) -> DeviceCapabilities:
+    def _detect_capabilities(self, device_id: str, api_level: Optional[str] = None) -> DeviceCapabilities:
         """Detect device capabilities.
-        
+
         Args:
             device_id: Device ID to check
-            
+            api_level: Already-known SDK level, avoids an extra device query
+
         Returns:
             DeviceCapabilities object
         """
         capabilities = DeviceCapabilities()
-        
-        # Check root access
-        su_result = self.adb.shell_command("su -c 'id'", device_id)
+
+        # Check root access with a short timeout: on non-rooted devices some
+        # su binaries block waiting for a confirmation prompt
+        su_result = self.adb.shell_command("su -c 'id'", device_id, timeout=2)
         capabilities.root_access = su_result.success and "uid=0" in su_result.output
-        
+
         # Check USB debugging (if we're connected, it's enabled)
         capabilities.usb_debugging = True
-        
-        # Check developer options
-        dev_options_result = self.adb.shell_command(
-            "settings get global development_settings_enabled", 
-            device_id
-        )
+
+        # Skip the wireless debugging probe entirely below API 30
+        if api_level is None:
+            api_level = self.adb._get_device_property(device_id, "ro.build.version.sdk")
+        try:
+            sdk_level = int(api_level)
+        except (TypeError, ValueError):
+            sdk_level = 0
+
+        # Remaining probes are independent device round-trips; run them in parallel
+        probes = {
+            "developer_options": "settings get global development_settings_enabled",
+            "bootloader": "getprop ro.boot.veritymode",
+        }
+        if sdk_level >= 30:
+            probes["wireless_debugging"] = "settings get global adb_wifi_enabled"
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = {
+                name: executor.submit(self.adb.shell_command, command, device_id)
+                for name, command in probes.items()
+            }
+            results = {name: future.result() for name, future in futures.items()}
+
+        dev_options_result = results["developer_options"]
         capabilities.developer_options = (
             dev_options_result.success and dev_options_result.output.strip() == "1"
         )
-        
-        # Check wireless debugging (API 30+)
-        if int(self.adb._get_device_property(device_id, "ro.build.version.sdk")) >= 30:
-            wireless_result = self.adb.shell_command(
-                "settings get global adb_wifi_enabled", 
-                device_id
-            )
+
+        if "wireless_debugging" in results:
+            wireless_result = results["wireless_debugging"]
             capabilities.wireless_debugging = (
                 wireless_result.success and wireless_result.output.strip() == "1"
             )
-        
-        # Check bootloader lock status
-        bootloader_result = self.adb.shell_command("getprop ro.boot.veritymode", device_id)
+
+        bootloader_result = results["bootloader"]
         capabilities.bootloader_unlocked = (
             bootloader_result.success and "disabled" in bootloader_result.output.lower()
         )
-        
+
         # Check fastboot availability (try to reboot to fastboot and back)
         # Note: This is potentially disruptive, so we'll be conservative
         capabilities.fastboot_available = capabilities.bootloader_unlocked
-        
+
         return capabilities
     
     def _get_battery_level(self, device_id: str) -> Optional[int]:
         """Get battery level percentage."""
-        result = self.adb.shell_command("dumpsys battery | grep level", device_id)
-        
+        result = self.adb.shell_command("dumpsys battery", device_id)
+
         if result.success:
-            try:
-                # Parse "level: 85" format
-                level_line = result.output.split('\n')[0]
-                level = int(level_line.split(':')[1].strip())
-                return level
-            except (IndexError, ValueError):
-                pass
-        
+            # Single regex scan over the short dumpsys output, no line splitting
+            match = _BATT_LEVEL.search(result.output)
+            if match:
+                return int(match.group(1))
+
         return None
     
     def _get_screen_info(self, device_id: str) -> Dict[str, str]:
@@ -406,12 +425,13 @@ class DeviceManager:
             with open(backup_file, 'r') as f:
                 backup_data = json.load(f)
             
-            # Restore system settings
+            # Restore system settings (quote values so embedded quotes
+            # can't break the shell command)
             for setting in backup_data.get("system_settings", []):
                 if '=' in setting:
                     key, value = setting.split('=', 1)
                     result = self.adb.shell_command(
-                        f"settings put system {key} '{value}'", 
+                        "settings put system %s %s" % (shlex.quote(key), shlex.quote(value)),
                         device_id
                     )
                     if result.success:
@@ -430,7 +450,7 @@ class DeviceManager:
                     key, value = setting.split('=', 1)
                     if key in safe_global_settings:
                         result = self.adb.shell_command(
-                            f"settings put global {key} '{value}'", 
+                            "settings put global %s %s" % (shlex.quote(key), shlex.quote(value)),
                             device_id
                         )
                         if result.success:
@@ -1,12 +1,34 @@
 """Fastboot wrapper for Android device flashing and recovery."""
 
+import asyncio
+import functools
+import os
 import subprocess
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import List, Dict, Optional
 from dataclasses import dataclass
 from pathlib import Path
 
-@dataclass
+@functools.lru_cache(maxsize=8)
+def _probe_fastboot(fastboot_path: str) -> bool:
+    """Check once per binary path that fastboot is runnable.
+
+    Cached at module level so constructing many managers doesn't re-fork
+    `fastboot --version` every time.
+    """
+    try:
+        result = subprocess.run(
+            [fastboot_path, "--version"],
+            capture_output=True,
+            text=True,
+            timeout=10
+        )
+        return result.returncode == 0
+    except (subprocess.TimeoutExpired, FileNotFoundError):
+        raise RuntimeError("Fastboot not found. Please install Android SDK Platform Tools.")
+
+@dataclass(slots=True)
 class FastbootResult:
     """Result of fastboot operation."""
     success: bool
@@ -14,7 +36,7 @@ class FastbootResult:
     error: str
     exit_code: int
 
-@dataclass
+@dataclass(slots=True)
 class FastbootDevice:
     """Fastboot device information."""
     id: str
@@ -33,17 +55,8 @@ class FastbootManager:
         self._check_fastboot_available()
     
     def _check_fastboot_available(self) -> bool:
-        """Check if fastboot is available."""
-        try:
-            result = subprocess.run(
-                [self.fastboot_path, "--version"], 
-                capture_output=True, 
-                text=True,
-                timeout=10
-            )
-            return result.returncode == 0
-        except (subprocess.TimeoutExpired, FileNotFoundError):
-            raise RuntimeError("Fastboot not found. Please install Android SDK Platform Tools.")
+        """Check if fastboot is available (cached per binary path)."""
+        return _probe_fastboot(self.fastboot_path)
     
     def _run_fastboot_command(
         self, 
@@ -98,6 +111,113 @@ class FastbootManager:
                 exit_code=-1
             )
     
+    async def _run_fastboot_async(
+        self,
+        args: List[str],
+        device_id: Optional[str] = None,
+        timeout: int = 60
+    ) -> FastbootResult:
+        """Async variant of _run_fastboot_command for concurrent orchestration.
+
+        A single event loop can overlap fastboot subprocesses across many
+        devices (e.g. flash -> reboot -> wait per device) without threads.
+
+        Args:
+            args: Fastboot command arguments
+            device_id: Target device ID (optional)
+            timeout: Command timeout in seconds
+
+        Returns:
+            FastbootResult with execution details
+        """
+        cmd = [self.fastboot_path]
+
+        if device_id:
+            cmd.extend(["-s", device_id])
+
+        cmd.extend(args)
+
+        try:
+            process = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE
+            )
+
+            try:
+                stdout, stderr = await asyncio.wait_for(process.communicate(), timeout)
+            except asyncio.TimeoutError:
+                process.kill()
+                await process.wait()
+                return FastbootResult(
+                    success=False,
+                    output="",
+                    error=f"Command timed out after {timeout} seconds",
+                    exit_code=-1
+                )
+
+            return FastbootResult(
+                success=process.returncode == 0,
+                output=stdout.decode(errors="replace").strip(),
+                error=stderr.decode(errors="replace").strip(),
+                exit_code=process.returncode
+            )
+
+        except Exception as e:
+            return FastbootResult(
+                success=False,
+                output="",
+                error=str(e),
+                exit_code=-1
+            )
+
+    async def flash_partition_async(
+        self,
+        partition: str,
+        image_path: str,
+        device_id: Optional[str] = None
+    ) -> FastbootResult:
+        """Async variant of flash_partition.
+
+        Args:
+            partition: Partition name (boot, recovery, system, etc.)
+            image_path: Path to image file
+            device_id: Target device ID
+
+        Returns:
+            FastbootResult with flash operation details
+        """
+        if not Path(image_path).exists():
+            return FastbootResult(
+                success=False,
+                output="",
+                error=f"Image file not found: {image_path}",
+                exit_code=1
+            )
+
+        return await self._run_fastboot_async(
+            ["flash", partition, image_path],
+            device_id,
+            timeout=300  # 5 minutes for flashing
+        )
+
+    async def wait_for_device_async(
+        self,
+        device_id: Optional[str] = None,
+        timeout: int = 60
+    ) -> bool:
+        """Async variant of wait_for_device using the native blocking wait.
+
+        Args:
+            device_id: Target device ID
+            timeout: Maximum wait time in seconds
+
+        Returns:
+            True if device is ready, False if timeout
+        """
+        result = await self._run_fastboot_async(["wait-for-device"], device_id, timeout=timeout)
+        return result.success
+
     def list_devices(self) -> List[FastbootDevice]:
         """List devices in fastboot mode.
         
@@ -110,9 +230,8 @@ class FastbootManager:
             return []
         
         devices = []
-        lines = result.output.split('\n')
-        
-        for line in lines:
+
+        for line in result.output.splitlines():
             if not line.strip():
                 continue
                 
@@ -263,24 +382,33 @@ class FastbootManager:
         ]
         
         device_info = {}
-        
-        for var in info_vars:
-            result = self._run_fastboot_command(["getvar", var], device_id)
-            if result.success:
-                # Fastboot getvar output is in stderr
-                output = result.error if result.error else result.output
-                
-                # Parse output: "variable: value"
-                for line in output.split('\n'):
-                    if f"{var}:" in line:
-                        value = line.split(':', 1)[1].strip()
-                        device_info[var] = value
-                        break
+
+        # Each getvar is an independent fork + USB round trip; issue them
+        # concurrently instead of paying the latency serially
+        with ThreadPoolExecutor(max_workers=len(info_vars)) as executor:
+            futures = {
+                executor.submit(self._run_fastboot_command, ["getvar", var], device_id): var
+                for var in info_vars
+            }
+
+            for future in as_completed(futures):
+                var = futures[future]
+                result = future.result()
+                if result.success:
+                    # Fastboot getvar output is in stderr
+                    output = result.error if result.error else result.output
+
+                    # Parse output: "variable: value"
+                    for line in output.splitlines():
+                        if f"{var}:" in line:
+                            value = line.split(':', 1)[1].strip()
+                            device_info[var] = value
+                            break
+                    else:
+                        device_info[var] = "unknown"
                 else:
                     device_info[var] = "unknown"
-            else:
-                device_info[var] = "unknown"
-        
+
         return device_info
     
     def unlock_bootloader(self, device_id: Optional[str] = None) -> FastbootResult:
@@ -359,9 +487,57 @@ class FastbootManager:
             timeout=600  # 10 minutes for full flash
         )
     
+    def flash_all_multi(
+        self,
+        zip_path: str,
+        device_ids: List[str],
+        wipe_user_data: bool = False,
+        max_workers: Optional[int] = None
+    ) -> Dict[str, FastbootResult]:
+        """Flash the same flashall package to multiple devices in parallel.
+
+        Each device gets its own fastboot process, so total wall-clock time
+        approaches the slowest single flash instead of the sum of all of them.
+        For real throughput the devices should sit on distinct USB root hubs.
+
+        Args:
+            zip_path: Path to flashall zip package
+            device_ids: Target device IDs to flash
+            wipe_user_data: Wipe user data during flash
+            max_workers: Maximum concurrent flashes (default: one per device,
+                capped at host CPU count)
+
+        Returns:
+            Dictionary mapping device IDs to their FastbootResult
+        """
+        if not Path(zip_path).exists():
+            error = FastbootResult(
+                success=False,
+                output="",
+                error=f"Flashall package not found: {zip_path}",
+                exit_code=1
+            )
+            return {device_id: error for device_id in device_ids}
+
+        if not device_ids:
+            return {}
+
+        max_workers = max_workers or min(len(device_ids), os.cpu_count() or 1)
+
+        results = {}
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(self.flash_all, zip_path, device_id, wipe_user_data): device_id
+                for device_id in device_ids
+            }
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
+
+        return results
+
     def wait_for_device(
-        self, 
-        device_id: Optional[str] = None, 
+        self,
+        device_id: Optional[str] = None,
         timeout: int = 60
     ) -> bool:
         """Wait for device to be ready in fastboot mode.
@@ -374,10 +550,22 @@ class FastbootManager:
             True if device is ready, False if timeout
         """
         start_time = time.time()
-        
+
+        # Delegate to the native blocking wait first: one subprocess instead
+        # of a poll loop
+        result = self._run_fastboot_command(["wait-for-device"], device_id, timeout=timeout)
+        if result.success:
+            return True
+        if "timed out" in result.error:
+            return False
+
+        # Older fastboot builds may not support wait-for-device; fall back to
+        # polling with exponential backoff (fast detection when the device
+        # comes up quickly, few polls when it's slow)
+        delay = 0.05
         while time.time() - start_time < timeout:
             devices = self.list_devices()
-            
+
             if device_id:
                 for device in devices:
                     if device.id == device_id:
@@ -385,9 +573,10 @@ class FastbootManager:
             else:
                 if devices:
                     return True
-            
-            time.sleep(2)
-        
+
+            time.sleep(delay)
+            delay = min(delay * 1.5, 1.0)
+
         return False
     
     def execute(
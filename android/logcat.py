@@ -1,8 +1,19 @@
 """Android logcat wrapper and log analysis tools."""
 
+import functools
+import heapq
+import io
+import json
+import operator
+import os
+import queue
+import selectors
+import shutil
 import subprocess
 import re
+import threading
 import time
+from collections import Counter, deque
 from typing import List, Dict, Optional, Iterator, Any
 from dataclasses import dataclass
 from datetime import datetime
@@ -18,6 +29,12 @@ class LogLevel(Enum):
     FATAL = "F"
     SILENT = "S"
 
+# O(1) level lookups for the parse/analyze hot paths: enum construction does
+# a member scan plus try/except on every call
+_LEVEL_MAP = {level.value: level for level in LogLevel}
+_LEVEL_IDX = {level.value: idx for idx, level in enumerate(LogLevel)}
+_LEVELS = tuple(LogLevel)
+
 @dataclass
 class LogEntry:
     """Structured log entry."""
@@ -39,12 +56,113 @@ class LogStats:
     warning_count: int
     crash_indicators: List[str]
 
+# Optional linear-time DFA matcher: google-re2 runs the hot scan loops in C
+# and can't hit backtracking blowups on the crash-pattern alternation
+try:
+    import re2 as _re2
+except ImportError:
+    _re2 = None
+
+def _compile(pattern: str, flags: int = 0):
+    """Compile with re2 when available, falling back to the stdlib matcher."""
+    if _re2 is not None:
+        try:
+            return _re2.compile(pattern, flags)
+        except Exception:
+            pass
+    return re.compile(pattern, flags)
+
+# Threadtime format: MM-DD HH:MM:SS.mmm PID TID L TAG: message
+_LOG_PATTERN = r'(\d{2}-\d{2}\s+\d{2}:\d{2}:\d{2}\.\d{3})\s+(\d+)\s+(\d+)\s+([VDIWEFS])\s+([^:]+):\s*(.*)'
+_LOG_RE = _compile(_LOG_PATTERN)
+
+# Line-anchored variant for scanning whole buffers without splitting them
+_LOG_SCAN_RE = _compile(r'(?m)^' + _LOG_PATTERN)
+
+# Optional multi-pattern substring automaton for the crash scan
+try:
+    import ahocorasick as _ahocorasick
+except ImportError:
+    _ahocorasick = None
+
+# Common crash/error markers; all but one are plain substrings, which lets a
+# single Aho-Corasick pass cover them when pyahocorasick is installed
+_CRASH_LITERALS = [
+    'FATAL EXCEPTION',
+    'SIGSEGV',
+    'SIGABRT',
+    'Native crash',
+    'tombstone',
+    'ANR in',
+    'Application Not Responding',
+    'OutOfMemoryError',
+    'StackOverflowError'
+]
+_CRASH_REGEX_PATTERNS = [r'AndroidRuntime.*FATAL']
+_CRASH_PATTERNS = _CRASH_LITERALS + _CRASH_REGEX_PATTERNS
+_CRASH_RE = _compile('|'.join(f'(?:{p})' for p in _CRASH_PATTERNS), re.IGNORECASE)
+_CRASH_REGEX_RES = [_compile(p, re.IGNORECASE) for p in _CRASH_REGEX_PATTERNS]
+
+# Precomputed alternation for device-side `logcat --regex` filtering
+_CRASH_REGEX_ARG = '|'.join(_CRASH_PATTERNS)
+
+def _build_crash_automaton():
+    """Build the Aho-Corasick automaton once, or None when unavailable."""
+    if _ahocorasick is None:
+        return None
+    automaton = _ahocorasick.Automaton()
+    for literal in _CRASH_LITERALS:
+        automaton.add_word(literal.lower(), literal)
+    automaton.make_automaton()
+    return automaton
+
+_CRASH_AUTOMATON = _build_crash_automaton()
+
+def _crash_line_starts(log_content: str) -> Optional[set]:
+    """Offsets of line starts containing a crash marker, or None.
+
+    One automaton pass over the whole buffer replaces a per-line regex
+    alternation search; the couple of genuinely regex-shaped patterns are
+    swept separately. str.lower() can change a string's length (e.g. 'İ'
+    maps to two characters), which would shift every offset found in the
+    lowered copy — in that rare case return None so the caller falls back
+    to the per-line regex scan.
+    """
+    lowered = log_content.lower()
+    if len(lowered) != len(log_content):
+        return None
+
+    starts = set()
+    for end_pos, _word in _CRASH_AUTOMATON.iter(lowered):
+        starts.add(log_content.rfind('\n', 0, end_pos) + 1)
+    for regex in _CRASH_REGEX_RES:
+        for match in regex.finditer(log_content):
+            starts.add(log_content.rfind('\n', 0, match.start()) + 1)
+    return starts
+
+@functools.lru_cache(maxsize=64)
+def _filter_spec(filter_tag: Optional[str], level_value: Optional[str]) -> Optional[str]:
+    """Build (and cache) the logcat filter spec for a tag/level pair."""
+    if filter_tag and level_value:
+        return f"{filter_tag}:{level_value}"
+    if filter_tag:
+        return f"{filter_tag}:V"  # Verbose level for tag
+    if level_value:
+        return f"*:{level_value}"  # All tags at level
+    return None
+
+# "main: ring buffer is 256Kb (255Kb consumed), max entry is 5120b, ..."
+# Newer logcat prints KiB/MiB units, hence the loose unit match
+_BUFFER_SIZE_RE = re.compile(
+    r'(\w+):\s+ring buffer is (\d+\s*[KkMm]i?[Bb]).*?\((\d+\s*[KkMm]i?[Bb]) consumed\)'
+)
+
 class LogcatManager:
     """Android logcat operations manager."""
-    
+
     def __init__(self, device_id: Optional[str] = None, adb_path: str = "adb"):
         """Initialize logcat manager.
-        
+
         Args:
             device_id: Target device ID
             adb_path: Path to adb binary
@@ -52,44 +170,70 @@ class LogcatManager:
         self.device_id = device_id
         self.adb_path = adb_path
         self._log_format = "threadtime"  # Default format
+        self._tap: Optional["LogcatTap"] = None
+        self._regex_filter_supported: Optional[bool] = None
+
+    def get_tap(self) -> "LogcatTap":
+        """Get the shared long-running logcat tap for this manager.
+
+        One background `adb logcat` process serves any number of concurrent
+        capture/stream consumers; repeated short captures don't each pay the
+        subprocess + adb-attach cost or lose lines between runs.
+
+        Returns:
+            Lazily-created LogcatTap bound to this manager
+        """
+        if self._tap is None:
+            self._tap = LogcatTap(self)
+        return self._tap
     
     def _build_logcat_command(
-        self, 
+        self,
         filter_spec: Optional[str] = None,
         buffer: Optional[str] = None,
         since: Optional[str] = None,
-        count: Optional[int] = None
+        count: Optional[int] = None,
+        pid: Optional[str] = None,
+        regex: Optional[str] = None
     ) -> List[str]:
         """Build logcat command with options.
-        
+
         Args:
             filter_spec: Log filter specification (tag:level)
             buffer: Log buffer (main, radio, events, system)
             since: Show logs since time/date
             count: Maximum number of lines
-            
+            pid: Only show logs from this process ID (filtered on-device)
+            regex: Only show lines matching this pattern (filtered on-device)
+
         Returns:
             Complete logcat command as list
         """
         cmd = [self.adb_path]
-        
+
         if self.device_id:
             cmd.extend(["-s", self.device_id])
-        
+
         cmd.extend(["logcat", "-v", self._log_format])
-        
+
         if buffer:
             cmd.extend(["-b", buffer])
-        
+
         if since:
             cmd.extend(["-t", since])
-        
+
         if count:
             cmd.extend(["-m", str(count)])
-        
+
+        if pid:
+            cmd.append(f"--pid={pid}")
+
+        if regex:
+            cmd.extend(["--regex", regex])
+
         if filter_spec:
             cmd.append(filter_spec)
-        
+
         return cmd
     
     def capture(
@@ -112,53 +256,95 @@ class LogcatManager:
         Returns:
             Captured log content as string
         """
-        filter_spec = None
-        if filter_tag and level:
-            filter_spec = f"{filter_tag}:{level.value}"
-        elif filter_tag:
-            filter_spec = f"{filter_tag}:V"  # Verbose level for tag
-        elif level:
-            filter_spec = f"*:{level.value}"  # All tags at level
-        
+        filter_spec = _filter_spec(filter_tag, level.value if level else None)
+
         cmd = self._build_logcat_command(filter_spec, buffer)
-        
+
         try:
             # Clear existing logs first
             clear_cmd = self._build_logcat_command()
             clear_cmd.append("-c")
             subprocess.run(clear_cmd, capture_output=True)
-            
-            # Start capturing
+
+            # Start capturing; binary pipes so we can chunk-read and split ourselves
             process = subprocess.Popen(
                 cmd,
                 stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                bufsize=1
+                stderr=subprocess.PIPE
             )
-            
+
             logs = []
-            start_time = time.time()
-            
-            while time.time() - start_time < duration:
-                if process.poll() is not None:
-                    break
-                
-                try:
-                    line = process.stdout.readline()
-                    if line:
-                        logs.append(line.strip())
-                        if save_to_file:
-                            with open(save_to_file, 'a') as f:
-                                f.write(line)
-                except Exception:
-                    break
-            
+            pending = b''
+
+            # Single persistent handle instead of reopening per line
+            save_file = open(save_to_file, 'ab', buffering=65536) if save_to_file else None
+
+            try:
+                # Monotonic deadline: one clock read per iteration, immune to
+                # wall-clock jumps
+                deadline = time.monotonic() + duration
+
+                if os.name == "posix":
+                    # Non-blocking chunk reads multiplexed through a selector;
+                    # select() only accepts pipe fds on POSIX
+                    fd = process.stdout.fileno()
+                    os.set_blocking(fd, False)
+
+                    selector = selectors.DefaultSelector()
+                    selector.register(process.stdout, selectors.EVENT_READ)
+
+                    try:
+                        while True:
+                            remaining = deadline - time.monotonic()
+                            if remaining <= 0 or process.poll() is not None:
+                                break
+
+                            if not selector.select(timeout=min(0.5, remaining)):
+                                continue
+
+                            try:
+                                chunk = os.read(fd, 65536)
+                            except BlockingIOError:
+                                continue
+                            if not chunk:
+                                break
+
+                            if save_file:
+                                save_file.write(chunk)
+
+                            # Keep any trailing partial line buffered for the next read
+                            pending += chunk
+                            *complete, pending = pending.split(b'\n')
+                            for raw_line in complete:
+                                line = raw_line.decode('utf-8', errors='replace').strip()
+                                if line:
+                                    logs.append(line)
+                    finally:
+                        selector.close()
+                else:
+                    # Portable fallback (Windows): blocking per-line reads
+                    # with the deadline re-checked after each line
+                    for raw_line in process.stdout:
+                        if save_file:
+                            save_file.write(raw_line)
+                        line = raw_line.decode('utf-8', errors='replace').strip()
+                        if line:
+                            logs.append(line)
+                        if time.monotonic() >= deadline:
+                            break
+            finally:
+                if save_file:
+                    save_file.close()
+
+            last_line = pending.decode('utf-8', errors='replace').strip()
+            if last_line:
+                logs.append(last_line)
+
             process.terminate()
             process.wait(timeout=5)
-            
+
             return '\n'.join(logs)
-            
+
         except Exception as e:
             raise RuntimeError(f"Failed to capture logs: {e}")
     
@@ -178,16 +364,17 @@ class LogcatManager:
         Yields:
             Log lines as they arrive
         """
-        filter_spec = None
-        if filter_tag and level:
-            filter_spec = f"{filter_tag}:{level.value}"
-        elif filter_tag:
-            filter_spec = f"{filter_tag}:V"
-        elif level:
-            filter_spec = f"*:{level.value}"
-        
+        # Unfiltered streams share the manager's long-running tap, so
+        # overlapping consumers reuse one subprocess and adb attach
+        if filter_tag is None and level is None and buffer is None:
+            yield from self.get_tap().stream()
+            return
+
+        # Filtering happens device-side via the logcat filterspec
+        filter_spec = _filter_spec(filter_tag, level.value if level else None)
+
         cmd = self._build_logcat_command(filter_spec, buffer)
-        
+
         try:
             process = subprocess.Popen(
                 cmd,
@@ -196,10 +383,12 @@ class LogcatManager:
                 text=True,
                 bufsize=1
             )
-            
-            for line in iter(process.stdout.readline, ''):
-                yield line.strip()
-                
+
+            # Iterating the pipe directly keeps the readline loop in C;
+            # rstrip drops only the trailing newline instead of both ends
+            for line in process.stdout:
+                yield line.rstrip('\n')
+
         except KeyboardInterrupt:
             process.terminate()
             raise
@@ -215,20 +404,14 @@ class LogcatManager:
         Returns:
             LogEntry object or None if parsing fails
         """
-        # Threadtime format: MM-DD HH:MM:SS.mmm PID TID L TAG: message
-        pattern = r'(\d{2}-\d{2}\s+\d{2}:\d{2}:\d{2}\.\d{3})\s+(\d+)\s+(\d+)\s+([VDIWEFS])\s+([^:]+):\s*(.*)'
-        
-        match = re.match(pattern, line)
+        match = _LOG_RE.match(line)
         if not match:
             return None
         
         timestamp, pid_str, tid_str, level_str, tag, message = match.groups()
-        
-        try:
-            level = LogLevel(level_str)
-        except ValueError:
-            level = LogLevel.VERBOSE
-        
+
+        level = _LEVEL_MAP.get(level_str, LogLevel.VERBOSE)
+
         return LogEntry(
             timestamp=timestamp,
             pid=int(pid_str),
@@ -239,69 +422,50 @@ class LogcatManager:
             raw_line=line
         )
     
-    def analyze_logs(self, log_content: str) -> LogStats:
+    def analyze_logs(self, log_content: str, top_tags_k: int = 50) -> LogStats:
         """Analyze log content and generate statistics.
-        
+
         Args:
             log_content: Raw log content
-            
+            top_tags_k: Keep only this many most frequent tags in by_tag
+
         Returns:
             LogStats with analysis results
         """
-        lines = log_content.split('\n')
-        total_lines = len([l for l in lines if l.strip()])
-        
-        by_level = {level: 0 for level in LogLevel}
-        by_tag = {}
-        error_count = 0
-        warning_count = 0
+        # Every non-empty line counts, including buffer headers and lines
+        # the scanner below can't parse — same semantics as splitting and
+        # filtering, in one C-level pass
+        total_lines = sum(1 for line in log_content.splitlines() if line.strip())
+
+        level_counts = [0] * len(_LEVELS)
+        by_tag = Counter()
         crash_indicators = []
-        
-        # Common crash/error patterns
-        crash_patterns = [
-            r'FATAL EXCEPTION',
-            r'AndroidRuntime.*FATAL',
-            r'SIGSEGV',
-            r'SIGABRT', 
-            r'Native crash',
-            r'tombstone',
-            r'ANR in',
-            r'Application Not Responding',
-            r'OutOfMemoryError',
-            r'StackOverflowError'
-        ]
-        
-        for line in lines:
-            if not line.strip():
-                continue
-                
-            entry = self.parse_log_line(line)
-            if not entry:
-                continue
-            
-            # Count by level
-            by_level[entry.level] += 1
-            
-            # Count by tag
-            if entry.tag in by_tag:
-                by_tag[entry.tag] += 1
-            else:
-                by_tag[entry.tag] = 1
-            
-            # Count errors and warnings
-            if entry.level == LogLevel.ERROR:
-                error_count += 1
-            elif entry.level == LogLevel.WARNING:
-                warning_count += 1
-            
-            # Check for crash indicators
-            for pattern in crash_patterns:
-                if re.search(pattern, line, re.IGNORECASE):
+
+        # Single scanner pass over the raw content for the per-line stats;
+        # unparseable lines are skipped by the scanner itself, no
+        # intermediate list of lines is built. Levels are tallied through a
+        # plain list indexed by a precomputed table so no enum is hashed
+        # inside the loop.
+        crash_starts = _crash_line_starts(log_content) if _CRASH_AUTOMATON is not None else None
+
+        level_idx = _LEVEL_IDX
+        for match in _LOG_SCAN_RE.finditer(log_content):
+            level_counts[level_idx.get(match.group(4), 0)] += 1
+            by_tag[match.group(5).strip()] += 1
+
+            line = match.group(0)
+            if crash_starts is None:
+                if _CRASH_RE.search(line):
                     crash_indicators.append(line.strip())
-                    break
-        
-        # Sort tags by frequency
-        by_tag = dict(sorted(by_tag.items(), key=lambda x: x[1], reverse=True))
+            elif match.start() in crash_starts:
+                crash_indicators.append(line.strip())
+
+        by_level = {level: level_counts[idx] for idx, level in enumerate(_LEVELS)}
+        error_count = by_level[LogLevel.ERROR]
+        warning_count = by_level[LogLevel.WARNING]
+
+        # Top-K tags by frequency: O(N log K) instead of sorting every tag
+        by_tag = dict(heapq.nlargest(top_tags_k, by_tag.items(), key=operator.itemgetter(1)))
         
         return LogStats(
             total_lines=total_lines,
@@ -343,31 +507,67 @@ class LogcatManager:
         except Exception:
             return ""
         
-        # Filter logs by PID
+        # Filter logs by PID: in threadtime format the PID sits right after
+        # the timestamp, so a substring probe over the line head rejects
+        # non-matching lines without paying the full parse regex
+        pid_probe = f" {pid} "
         filtered_lines = []
-        for line in log_content.split('\n'):
+        # StringIO streams line-by-line without materializing a list copy
+        for line in io.StringIO(log_content):
+            if pid_probe not in line[:32]:
+                continue
+            line = line.rstrip('\n')
+            # Confirm candidates with a real parse (the probe can also hit a TID)
             entry = self.parse_log_line(line)
             if entry and str(entry.pid) == pid:
                 filtered_lines.append(line)
-        
+
         return '\n'.join(filtered_lines)
     
-    def get_crash_logs(self, since_minutes: int = 60) -> str:
+    def _supports_regex_filter(self) -> bool:
+        """Probe once whether the device-side logcat accepts --regex.
+
+        Returns:
+            True if --regex filtering is available (Android 7+)
+        """
+        if self._regex_filter_supported is None:
+            cmd = [self.adb_path]
+            if self.device_id:
+                cmd.extend(["-s", self.device_id])
+            cmd.extend(["shell", "logcat", "--help"])
+
+            try:
+                result = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
+                self._regex_filter_supported = "--regex" in (result.stdout + result.stderr)
+            except Exception:
+                self._regex_filter_supported = False
+
+        return self._regex_filter_supported
+
+    def get_crash_logs(self, since_minutes: int = 60, markers_only: bool = False) -> str:
         """Get recent crash-related logs.
-        
+
         Args:
             since_minutes: Look back this many minutes
-            
+            markers_only: Filter to crash-marker lines on the device,
+                dropping the stack-trace/detail lines that follow them
+
         Returns:
             Crash-related log content
         """
         since_time = f"{since_minutes}m ago"
-        
+
         # Filter for potential crash indicators
         crash_filter = "*:E AndroidRuntime:D System.err:V"
-        
-        cmd = self._build_logcat_command(crash_filter, since=since_time)
-        
+
+        # Device-side --regex keeps only lines matching a crash marker,
+        # which discards the stack-trace bodies — useful to cheaply probe
+        # whether anything crashed, wrong as the default
+        regex = None
+        if markers_only and self._supports_regex_filter():
+            regex = _CRASH_REGEX_ARG
+        cmd = self._build_logcat_command(crash_filter, since=since_time, regex=regex)
+
         try:
             result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
             return result.stdout if result.returncode == 0 else ""
@@ -396,31 +596,30 @@ class LogcatManager:
             Dictionary with buffer size info
         """
         buffers = ["main", "system", "radio", "events", "crash"]
-        buffer_info = {}
-        
-        for buffer in buffers:
-            cmd = self._build_logcat_command(buffer=buffer)
-            cmd.extend(["-g"])  # Get buffer size
-            
-            try:
-                result = subprocess.run(cmd, capture_output=True, text=True)
-                if result.returncode == 0:
-                    # Parse output: "main: ring buffer is 256Kb (255Kb consumed), max entry is 5120b, max payload is 4068b"
-                    output = result.stdout.strip()
-                    size_match = re.search(r'(\d+)Kb.*\((\d+)Kb consumed\)', output)
-                    if size_match:
-                        buffer_info[buffer] = {
-                            "total_size": f"{size_match.group(1)}Kb",
-                            "used_size": f"{size_match.group(2)}Kb",
-                            "available": result.returncode == 0
-                        }
-                    else:
-                        buffer_info[buffer] = {"available": True}
-                else:
-                    buffer_info[buffer] = {"available": False}
-            except Exception:
-                buffer_info[buffer] = {"available": False}
-        
+        buffer_info = {buffer: {"available": False} for buffer in buffers}
+
+        # One "-b all -g" invocation reports every buffer, instead of one
+        # adb round-trip per buffer
+        cmd = self._build_logcat_command(buffer="all")
+        cmd.append("-g")  # Get buffer size
+
+        try:
+            result = subprocess.run(cmd, capture_output=True, text=True)
+            if result.returncode == 0:
+                # The query itself succeeded, so report every buffer
+                # available even if its size line has a format the regex
+                # doesn't recognize
+                for info in buffer_info.values():
+                    info["available"] = True
+                for match in _BUFFER_SIZE_RE.finditer(result.stdout):
+                    buffer_info[match.group(1)] = {
+                        "total_size": match.group(2).replace(" ", ""),
+                        "used_size": match.group(3).replace(" ", ""),
+                        "available": True
+                    }
+        except Exception:
+            pass
+
         return buffer_info
     
     def export_logs(
@@ -442,35 +641,234 @@ class LogcatManager:
             True if successful, False otherwise
         """
         cmd = self._build_logcat_command(filter_spec, since=since)
-        
+
+        # "-t <since>" already implies a one-shot dump; without it logcat
+        # streams forever, so ask for a dump explicitly to bound the export
+        if since is None:
+            cmd.append("-d")
+
         try:
             if format_type == "json":
-                # Custom JSON export
-                result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
-                if result.returncode == 0:
-                    logs = []
-                    for line in result.stdout.split('\n'):
-                        entry = self.parse_log_line(line)
-                        if entry:
-                            logs.append({
-                                "timestamp": entry.timestamp,
-                                "pid": entry.pid,
-                                "tid": entry.tid,
-                                "level": entry.level.value,
-                                "tag": entry.tag,
-                                "message": entry.message
-                            })
-                    
-                    import json
+                # Stream the dump and emit JSON entries incrementally so peak
+                # memory stays flat regardless of capture size
+                process = subprocess.Popen(
+                    cmd,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.DEVNULL,
+                    text=True,
+                    bufsize=65536
+                )
+                try:
                     with open(output_file, 'w') as f:
-                        json.dump(logs, f, indent=2)
-                    return True
+                        f.write('[\n')
+                        first = True
+                        for line in process.stdout:
+                            match = _LOG_RE.match(line)
+                            if not match:
+                                continue
+                            timestamp, pid_str, tid_str, level_str, tag, message = match.groups()
+                            if not first:
+                                f.write(',\n')
+                            json.dump({
+                                "timestamp": timestamp,
+                                "pid": int(pid_str),
+                                "tid": int(tid_str),
+                                "level": level_str,
+                                "tag": tag.strip(),
+                                "message": message.strip()
+                            }, f)
+                            first = False
+                        f.write('\n]\n')
+                finally:
+                    process.stdout.close()
+                try:
+                    return process.wait(timeout=60) == 0
+                except subprocess.TimeoutExpired:
+                    process.kill()
+                    process.wait()
+                    return False
             else:
-                # Direct export to file
-                with open(output_file, 'w') as f:
-                    result = subprocess.run(cmd, stdout=f, stderr=subprocess.PIPE, timeout=60)
-                    return result.returncode == 0
+                # Direct export: move the pipe output in 1 MiB blocks; on
+                # Linux os.splice does the pipe->file copy in-kernel. The -d
+                # dump above guarantees the copy loop reaches EOF.
+                process = subprocess.Popen(
+                    cmd,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.DEVNULL
+                )
+                try:
+                    with open(output_file, 'wb') as f:
+                        if hasattr(os, "splice"):
+                            in_fd = process.stdout.fileno()
+                            out_fd = f.fileno()
+                            while os.splice(in_fd, out_fd, 1 << 20):
+                                pass
+                        else:
+                            shutil.copyfileobj(process.stdout, f, length=1 << 20)
+                finally:
+                    process.stdout.close()
+                try:
+                    return process.wait(timeout=60) == 0
+                except subprocess.TimeoutExpired:
+                    process.kill()
+                    process.wait()
+                    return False
         except Exception:
             return False
-        
-        return False
\ No newline at end of file
+
+class LogcatTap:
+    """Single long-running logcat reader shared by many consumers.
+
+    A background thread owns one `adb logcat` subprocess, keeps a ring
+    buffer of recent lines, and fans new lines out to subscriber queues.
+    Consumers come and go without restarting the subprocess, so overlapping
+    captures share one adb attach and no lines are lost between runs.
+    """
+
+    def __init__(self, manager: LogcatManager, buffer_lines: int = 200_000):
+        """Initialize logcat tap.
+
+        Args:
+            manager: LogcatManager providing device/adb configuration
+            buffer_lines: Ring buffer capacity for recent lines
+        """
+        self.manager = manager
+        self.buffer = deque(maxlen=buffer_lines)
+        self._subscribers: List[queue.Queue] = []
+        self._lock = threading.Lock()
+        self._process: Optional[subprocess.Popen] = None
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+
+    def start(self) -> None:
+        """Start the background reader if it isn't already running."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+
+        self._closed = False
+        cmd = self.manager._build_logcat_command()
+        self._process = subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            bufsize=1
+        )
+        self._thread = threading.Thread(target=self._pump, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the background reader and its subprocess."""
+        if self._process is not None:
+            self._process.terminate()
+            try:
+                self._process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                self._process.kill()
+            self._process = None
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def _pump(self) -> None:
+        """Read lines from the subprocess and fan them out.
+
+        When the subprocess exits, a None sentinel is pushed to every
+        subscriber so blocked consumers see end-of-stream instead of
+        waiting forever.
+        """
+        process = self._process
+        try:
+            for line in process.stdout:
+                line = line.rstrip('\n')
+                self.buffer.append(line)
+                with self._lock:
+                    subscribers = list(self._subscribers)
+                for subscriber in subscribers:
+                    subscriber.put(line)
+        finally:
+            with self._lock:
+                self._closed = True
+                subscribers = list(self._subscribers)
+            for subscriber in subscribers:
+                subscriber.put(None)
+
+    def subscribe(self) -> queue.Queue:
+        """Register a new consumer queue receiving all future lines."""
+        subscriber = queue.Queue()
+        with self._lock:
+            self._subscribers.append(subscriber)
+            closed = self._closed
+        if closed:
+            subscriber.put(None)
+        return subscriber
+
+    def unsubscribe(self, subscriber: queue.Queue) -> None:
+        """Remove a consumer queue."""
+        with self._lock:
+            try:
+                self._subscribers.remove(subscriber)
+            except ValueError:
+                pass
+
+    def capture(self, duration: int = 30) -> str:
+        """Collect lines arriving over the next duration seconds.
+
+        Args:
+            duration: Capture window in seconds
+
+        Returns:
+            Captured log content as string
+        """
+        self.start()
+        subscriber = self.subscribe()
+        lines = []
+        deadline = time.monotonic() + duration
+
+        try:
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    line = subscriber.get(timeout=min(0.5, remaining))
+                except queue.Empty:
+                    continue
+                if line is None:  # Subprocess exited
+                    break
+                lines.append(line)
+        finally:
+            self.unsubscribe(subscriber)
+
+        return '\n'.join(lines)
+
+    def stream(self) -> Iterator[str]:
+        """Stream lines in real-time from the shared subprocess.
+
+        Yields:
+            Log lines as they arrive, ending when the subprocess exits
+        """
+        self.start()
+        subscriber = self.subscribe()
+        try:
+            while True:
+                line = subscriber.get()
+                if line is None:  # Subprocess exited
+                    return
+                yield line
+        finally:
+            self.unsubscribe(subscriber)
+
+    def recent(self, max_lines: Optional[int] = None) -> str:
+        """Get the most recent buffered lines without waiting.
+
+        Args:
+            max_lines: Limit to this many trailing lines
+
+        Returns:
+            Buffered log content as string
+        """
+        lines = list(self.buffer)
+        if max_lines is not None:
+            lines = lines[-max_lines:]
+        return '\n'.join(lines)
@@ -1 +1,67 @@
-"""CLI commands package."""
\ No newline at end of file
+"""CLI command modules."""
+
+import functools
+
+_console = None
+
+def get_console():
+    """Return the shared Rich console, importing rich on first use.
+
+    The rich/pygments import chain dominates CLI startup for short commands,
+    so it's deferred until something actually prints.
+    """
+    global _console
+    if _console is None:
+        from rich.console import Console
+        _console = Console()
+    return _console
+
+def safe_command(fn):
+    """Wrap a command with the shared ImportError/Exception handlers.
+
+    Commands that only need the generic handlers apply this instead of
+    repeating the same try/except scaffolding in every body; commands with
+    bespoke handlers (timeouts, missing binaries) keep their own.
+    """
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        try:
+            return fn(*args, **kwargs)
+        except ImportError as e:
+            get_console().print(f"❌ Required modules not available: {e}")
+        except KeyboardInterrupt:
+            raise
+        except Exception as e:
+            get_console().print(f"❌ Error: {e}")
+    return wrapper
+
+def make_table(title: str, cols):
+    """Build a Rich Table from a ((header, style), ...) column schema.
+
+    Command modules declare their schemas once at module level instead of
+    repeating add_column calls per invocation.
+    """
+    from rich.table import Table
+    table = Table(title=title)
+    for header, style in cols:
+        table.add_column(header, style=style)
+    return table
+
+def json_dumps(obj, indent: bool = False) -> str:
+    """Serialize to JSON via orjson when installed, stdlib json otherwise."""
+    try:
+        import orjson
+    except ImportError:
+        import json
+        return json.dumps(obj, indent=2 if indent else None, default=str)
+    option = orjson.OPT_INDENT_2 if indent else 0
+    return orjson.dumps(obj, option=option, default=str).decode()
+
+def json_loads(data):
+    """Parse JSON via orjson when installed, stdlib json otherwise."""
+    try:
+        import orjson
+    except ImportError:
+        import json
+        return json.loads(data)
+    return orjson.loads(data)
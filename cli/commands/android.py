@@ -1,13 +1,17 @@
 """Android development commands."""
 
+import os
 import typer
-from rich.console import Console
-from rich.table import Table
 from typing import Optional, List
 from pathlib import Path
 
+from cli.commands import get_console, json_dumps, make_table, safe_command
+
 android_app = typer.Typer(help="🤖 Android development automation commands")
-console = Console()
+
+# Static table column schemas, declared once
+_DEVICES_COLS = (("Device ID", "cyan"), ("Status", "green"), ("Model", "yellow"))
+_BUILD_INFO_COLS = (("Property", "cyan"), ("Value", "white"))
 
 @android_app.command()
 def devices(
@@ -18,34 +22,34 @@ def devices(
         from android.adb import ADBManager
         adb = ADBManager()
         devices = adb.list_devices()
-        
+
         if json_output:
-            import json
-            console.print(json.dumps(devices))
-        else:
-            if not devices:
-                console.print("❌ No devices found")
-                return
-                
-            table = Table(title="📱 Connected Android Devices")
-            table.add_column("Device ID", style="cyan")
-            table.add_column("Status", style="green")
-            table.add_column("Model", style="yellow")
-            
-            for device in devices:
-                table.add_row(
-                    device.get("id", "unknown"),
-                    device.get("status", "unknown"),
-                    device.get("model", "unknown")
-                )
-            console.print(table)
-            
+            # Plain stdout write; CI callers skip the whole rich import chain
+            import sys
+            from dataclasses import asdict
+            sys.stdout.write(json_dumps([asdict(d) for d in devices]) + '\n')
+            return
+
+        console = get_console()
+        if not devices:
+            console.print("❌ No devices found")
+            return
+
+        table = make_table("📱 Connected Android Devices", _DEVICES_COLS)
+
+        # AndroidDevice is a typed dataclass; attribute access beats the
+        # dict.get-with-default chain per column
+        for device in devices:
+            table.add_row(device.id, device.status, device.model)
+        console.print(table)
+
     except ImportError:
-        console.print("❌ Android module not available")
+        get_console().print("❌ Android module not available")
     except Exception as e:
-        console.print(f"❌ Error: {e}")
+        get_console().print(f"❌ Error: {e}")
 
 @android_app.command()
+@safe_command
 def logcat(
     device: Optional[str] = typer.Option(None, "--device", "-d", help="Target device ID"),
     filter_tag: Optional[str] = typer.Option(None, "--filter", "-f", help="Filter by tag"),
@@ -53,6 +57,7 @@ def logcat(
     save: Optional[Path] = typer.Option(None, "--save", help="Save logs to file")
 ):
     """Capture and analyze Android logs."""
+    console = get_console()
     try:
         from android.logcat import LogcatManager
         from agents.log_analyzer import LogAnalyzer
@@ -71,18 +76,23 @@ def logcat(
                 console.print(f"🔍 Filter: {filter_tag}")
             
             logs = logcat.stream(filter_tag=filter_tag)
-            for log_line in logs:
-                if save:
-                    with open(save, 'a') as f:
-                        f.write(log_line + '\n')
-                console.print(log_line)
-                
-    except ImportError as e:
-        console.print(f"❌ Required modules not available: {e}")
+
+            # One line-buffered handle for the whole stream instead of an
+            # open/close syscall pair per log line
+            save_file = open(save, 'a', buffering=1) if save else None
+            try:
+                for log_line in logs:
+                    if save_file:
+                        save_file.write(log_line + '\n')
+                    # Skip markup parsing and syntax highlighting per line;
+                    # at logcat rates they dominate the loop
+                    console.print(log_line, markup=False, highlight=False, soft_wrap=True)
+            finally:
+                if save_file:
+                    save_file.close()
+
     except KeyboardInterrupt:
         console.print("\n⏹️  Log capture stopped")
-    except Exception as e:
-        console.print(f"❌ Error: {e}")
 
 @android_app.command()
 def install(
@@ -92,10 +102,11 @@ def install(
     test: bool = typer.Option(False, "--test", "-t", help="Install as test APK")
 ):
     """Install APK on Android device."""
+    console = get_console()
     try:
         from android.adb import ADBManager
         
-        if not apk_path.exists():
+        if not os.path.exists(apk_path):
             console.print(f"❌ APK file not found: {apk_path}")
             return
             
@@ -128,28 +139,30 @@ def shell(
     """Execute shell command on Android device."""
     try:
         from android.adb import ADBManager
-        
+
         adb = ADBManager()
         result = adb.shell_command(command, device_id=device)
-        
+
         if json_output:
-            import json
-            console.print(json.dumps({
+            import sys
+            sys.stdout.write(json_dumps({
                 "command": command,
                 "success": result.success,
                 "output": result.output,
                 "error": result.error
-            }))
+            }) + '\n')
+            return
+
+        console = get_console()
+        if result.success:
+            console.print(result.output)
         else:
-            if result.success:
-                console.print(result.output)
-            else:
-                console.print(f"❌ Command failed: {result.error}")
-                
+            console.print(f"❌ Command failed: {result.error}")
+
     except ImportError:
-        console.print("❌ Android ADB module not available")
+        get_console().print("❌ Android ADB module not available")
     except Exception as e:
-        console.print(f"❌ Error: {e}")
+        get_console().print(f"❌ Error: {e}")
 
 @android_app.command()
 def build_info(
@@ -159,26 +172,26 @@ def build_info(
     """Get Android device build information."""
     try:
         from android.adb import ADBManager
-        
+
         adb = ADBManager()
         build_info = adb.get_build_info(device_id=device)
-        
+
         if json_output:
-            import json
-            console.print(json.dumps(build_info))
-        else:
-            table = Table(title="📱 Device Build Information")
-            table.add_column("Property", style="cyan")
-            table.add_column("Value", style="white")
-            
-            for key, value in build_info.items():
-                table.add_row(key, str(value))
-            console.print(table)
-            
+            import sys
+            sys.stdout.write(json_dumps(build_info) + '\n')
+            return
+
+        console = get_console()
+        table = make_table("📱 Device Build Information", _BUILD_INFO_COLS)
+
+        for key, value in build_info.items():
+            table.add_row(key, str(value))
+        console.print(table)
+
     except ImportError:
-        console.print("❌ Android ADB module not available")
+        get_console().print("❌ Android ADB module not available")
     except Exception as e:
-        console.print(f"❌ Error: {e}")
+        get_console().print(f"❌ Error: {e}")
 
 @android_app.command()
 def fastboot(
@@ -187,6 +200,7 @@ def fastboot(
     device: Optional[str] = typer.Option(None, "--device", "-d", help="Target device ID")
 ):
     """Execute fastboot commands."""
+    console = get_console()
     try:
         from android.fastboot import FastbootManager
         
@@ -1,16 +1,15 @@
 """CI/CD integration commands."""
 
 import typer
-from rich.console import Console
-from rich.table import Table
 from typing import Optional, List
 from pathlib import Path
 import json
 import subprocess
 import os
 
+from cli.commands import get_console
+
 ci_app = typer.Typer(help="🚀 CI/CD integration and automation")
-console = Console()
 
 @ci_app.command()
 def setup_github(
@@ -19,8 +18,9 @@ def setup_github(
     cadx_integration: bool = typer.Option(True, "--cadx", help="Include CADX automation")
 ):
     """Setup GitHub Actions workflows with CADX integration."""
+    console = get_console()
     try:
-        if not project_path.exists():
+        if not os.path.exists(project_path):
             console.print(f"❌ Project path not found: {project_path}")
             return
         
@@ -178,6 +178,7 @@ def run_quiet(
     timeout: Optional[int] = typer.Option(300, "--timeout", help="Timeout in seconds")
 ):
     """Run CADX commands in quiet mode for CI/CD pipelines."""
+    console = get_console()
     try:
         import subprocess
         import json
@@ -280,6 +281,7 @@ def validate_pr(
     auto_fix: bool = typer.Option(False, "--fix", help="Auto-fix detected issues")
 ):
     """Validate pull request with CADX analysis."""
+    console = get_console()
     try:
         console.print(f"🔍 Validating PR #{pr_number or 'current'}")
         
@@ -307,7 +309,7 @@ def validate_pr(
         
         # Analyze each changed file
         for file_path in changed_files:
-            if not Path(file_path).exists():
+            if not os.path.exists(file_path):
                 continue
                 
             file_ext = Path(file_path).suffix
@@ -370,6 +372,7 @@ def deploy_check(
     run_tests: bool = typer.Option(True, "--tests", help="Run automated tests")
 ):
     """Pre-deployment checks and validation."""
+    console = get_console()
     try:
         console.print(f"🚀 Deploy check for: {environment}")
         
@@ -381,7 +384,7 @@ def deploy_check(
         }
         
         # APK validation
-        if apk_path and apk_path.exists():
+        if apk_path and os.path.exists(apk_path):
             console.print(f"📱 Validating APK: {apk_path}")
             # TODO: APK analysis with aapt
             checks["checks"].append({
@@ -441,6 +444,7 @@ def monitor(
     webhook: Optional[str] = typer.Option(None, "--webhook", help="Webhook URL for notifications")
 ):
     """Monitor CI/CD pipeline health."""
+    console = get_console()
     try:
         console.print(f"📊 Monitoring for {duration} seconds...")
         
@@ -1,15 +1,62 @@
 """Codex CLI integration commands."""
 
+import os
 import typer
-from rich.console import Console
-from rich.panel import Panel
 from typing import Optional, List
 from pathlib import Path
 import subprocess
-import json
+
+from cli.commands import get_console, json_dumps, json_loads
 
 codex_app = typer.Typer(help="🔧 Codex CLI integration and automation")
-console = Console()
+
+# Base argv for each codex subcommand, built once; per-call code only
+# appends the varying arguments
+_SUGGEST_BASE = ("codex", "suggest")
+_EDIT_BASE = ("codex", "edit")
+_FULL_AUTO_BASE = ("codex", "full-auto")
+_QUIET_BASE = ("codex", "--quiet")
+
+# Static codex.md template, built once at import time
+_CODEX_INSTRUCTIONS_MD = """# Codex Instructions for Android Development
+
+## Project Context
+This is an Android development project using CADX (Codex-Android-AI-Agent).
+
+## Code Style Guidelines
+- Follow Android Kotlin style guide
+- Use meaningful variable and function names  
+- Add KDoc comments for public APIs
+- Prefer Kotlin coroutines over callbacks
+
+## Android Specific Rules
+- Use ViewBinding instead of findViewById
+- Implement proper lifecycle management
+- Handle configuration changes properly
+- Use Android Architecture Components (ViewModel, LiveData, Room)
+- Follow Material Design principles
+
+## Build System
+- Use Gradle Kotlin DSL when possible
+- Keep dependencies up to date
+- Use version catalogs for dependency management
+
+## Testing
+- Write unit tests with JUnit and Mockk
+- Use Espresso for UI tests
+- Aim for >80% code coverage
+
+## Common Tasks
+- When adding new features, create proper separation of concerns
+- Always handle errors gracefully with try-catch or Result types
+- Use proper logging with Timber or similar
+- Implement offline-first architecture when applicable
+
+## CADX Integration
+- Use `cadx android logcat-analyze` for log analysis
+- Use `cadx agents fix-code` for automated code fixes
+- Use `cadx codex suggest` for code suggestions
+"""
 
 @codex_app.command()
 def suggest(
@@ -19,8 +66,9 @@ def suggest(
     apply: bool = typer.Option(False, "--apply", help="Auto-apply suggestion")
 ):
     """Generate code suggestions using Codex CLI."""
+    console = get_console()
     try:
-        cmd = ["codex", "suggest", prompt]
+        cmd = [*_SUGGEST_BASE, prompt]
         
         if file_path:
             cmd.extend(["--file", str(file_path)])
@@ -34,6 +82,7 @@ def suggest(
         
         if result.returncode == 0:
             console.print("✅ Codex suggestion generated:")
+            from rich.panel import Panel
             console.print(Panel(result.stdout, title="💡 Suggestion"))
             if apply and file_path:
                 console.print(f"✅ Applied to: {file_path}")
@@ -55,12 +104,13 @@ def auto_edit(
     preview: bool = typer.Option(False, "--preview", help="Preview changes only")
 ):
     """Auto-edit files using Codex CLI."""
+    console = get_console()
     try:
-        if not file_path.exists():
+        if not os.path.exists(file_path):
             console.print(f"❌ File not found: {file_path}")
             return
         
-        cmd = ["codex", "edit", str(file_path), instruction]
+        cmd = [*_EDIT_BASE, str(file_path), instruction]
         
         if backup:
             cmd.append("--backup")
@@ -73,6 +123,7 @@ def auto_edit(
         if result.returncode == 0:
             if preview:
                 console.print("📋 Preview of changes:")
+                from rich.panel import Panel
                 console.print(Panel(result.stdout, title="🔍 Changes"))
             else:
                 console.print("✅ File edited successfully")
@@ -95,12 +146,13 @@ def full_auto(
     quiet: bool = typer.Option(False, "--quiet", help="Quiet mode for CI")
 ):
     """Full auto mode - let Codex handle complex tasks."""
+    console = get_console()
     try:
-        if not project_path.exists():
+        if not os.path.exists(project_path):
             console.print(f"❌ Project path not found: {project_path}")
             return
         
-        cmd = ["codex", "full-auto", str(project_path), task]
+        cmd = [*_FULL_AUTO_BASE, str(project_path), task]
         
         if config_file:
             cmd.extend(["--config", str(config_file)])
@@ -112,18 +164,24 @@ def full_auto(
         console.print(f"📋 Task: {task}")
         
         if quiet:
-            result = subprocess.run(cmd, capture_output=True, text=True)
-            if result.returncode == 0:
+            # Binary pipes skip run()'s text decoding; communicate() drains
+            # stdout and stderr concurrently so neither pipe can fill and
+            # stall the child while the other is being read
+            proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+            output, stderr = proc.communicate()
+            returncode = proc.returncode
+
+            if returncode == 0:
                 console.print("✅ Task completed successfully")
-                if result.stdout:
+                if output:
                     try:
-                        output_data = json.loads(result.stdout)
-                        console.print(json.dumps(output_data, indent=2))
-                    except json.JSONDecodeError:
-                        console.print(result.stdout)
+                        output_data = json_loads(output)
+                        console.print(json_dumps(output_data, indent=True))
+                    except ValueError:
+                        console.print(output.decode(errors='replace'))
             else:
                 console.print("❌ Task failed:")
-                console.print(result.stderr)
+                console.print(stderr.decode(errors='replace'))
         else:
             # Interactive mode
             subprocess.run(cmd)
@@ -136,15 +194,26 @@ def full_auto(
 @codex_app.command()
 def status():
     """Check Codex CLI installation and status."""
+    console = get_console()
     try:
-        result = subprocess.run(["codex", "--version"], capture_output=True, text=True)
-        
+        from concurrent.futures import ThreadPoolExecutor
+
+        # The version and config spawns are independent; overlap them so the
+        # command pays for one fork+exec round trip instead of two
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            version_future = executor.submit(
+                subprocess.run, ["codex", "--version"], capture_output=True, text=True
+            )
+            config_future = executor.submit(
+                subprocess.run, ["codex", "config", "list"], capture_output=True, text=True
+            )
+            result = version_future.result()
+            config_result = config_future.result()
+
         if result.returncode == 0:
             console.print("✅ Codex CLI is installed")
             console.print(f"Version: {result.stdout.strip()}")
-            
-            # Check configuration
-            config_result = subprocess.run(["codex", "config", "list"], capture_output=True, text=True)
+
             if config_result.returncode == 0:
                 console.print("\n📝 Current Configuration:")
                 console.print(config_result.stdout)
@@ -167,8 +236,9 @@ def init_project(
     create_codex_md: bool = typer.Option(True, "--codex-md", help="Create codex.md instructions")
 ):
     """Initialize project with Codex CLI integration."""
+    console = get_console()
     try:
-        if not project_path.exists():
+        if not os.path.exists(project_path):
             console.print(f"❌ Project path not found: {project_path}")
             return
         
@@ -177,50 +247,9 @@ def init_project(
         # Create codex.md with Android-specific instructions
         if create_codex_md:
             codex_md_path = project_path / "codex.md"
-            
-            codex_instructions = """# Codex Instructions for Android Development
-
-## Project Context
-This is an Android development project using CADX (Codex-Android-AI-Agent).
 
-## Code Style Guidelines
-- Follow Android Kotlin style guide
-- Use meaningful variable and function names  
-- Add KDoc comments for public APIs
-- Prefer Kotlin coroutines over callbacks
-
-## Android Specific Rules
-- Use ViewBinding instead of findViewById
-- Implement proper lifecycle management
-- Handle configuration changes properly
-- Use Android Architecture Components (ViewModel, LiveData, Room)
-- Follow Material Design principles
-
-## Build System
-- Use Gradle Kotlin DSL when possible
-- Keep dependencies up to date
-- Use version catalogs for dependency management
-
-## Testing
-- Write unit tests with JUnit and Mockk
-- Use Espresso for UI tests
-- Aim for >80% code coverage
-
-## Common Tasks
-- When adding new features, create proper separation of concerns
-- Always handle errors gracefully with try-catch or Result types
-- Use proper logging with Timber or similar
-- Implement offline-first architecture when applicable
-
-## CADX Integration
-- Use `cadx android logcat-analyze` for log analysis
-- Use `cadx agents fix-code` for automated code fixes
-- Use `cadx codex suggest` for code suggestions
-"""
-            
             if android_focused:
-                with open(codex_md_path, 'w') as f:
-                    f.write(codex_instructions)
+                codex_md_path.write_text(_CODEX_INSTRUCTIONS_MD, encoding='utf-8')
                 console.print(f"✅ Created: {codex_md_path}")
         
         # Initialize Codex CLI in project
@@ -249,6 +278,7 @@ def task_pack(
     list_packs: bool = typer.Option(False, "--list", help="List available task packs")
 ):
     """Execute predefined task packs."""
+    console = get_console()
     try:
         if list_packs:
             from examples.task_packs import list_available_packs
@@ -286,12 +316,16 @@ def quiet_mode(
     timeout: Optional[int] = typer.Option(300, "--timeout", help="Command timeout in seconds")
 ):
     """Run Codex CLI commands in quiet mode for CI/CD."""
+    console = get_console()
     try:
-        cmd = ["codex", "--quiet"]
+        import shlex
+
+        cmd = [*_QUIET_BASE]
         if json_output:
             cmd.append("--json")
-        
-        cmd.extend(command.split())
+
+        # shlex keeps quoted arguments intact, unlike naive str.split
+        cmd.extend(shlex.split(command))
         
         console.print(f"🤫 Running in quiet mode: {command}")
         
@@ -300,9 +334,9 @@ def quiet_mode(
         if result.returncode == 0:
             if json_output:
                 try:
-                    output_data = json.loads(result.stdout)
-                    console.print(json.dumps(output_data, indent=2))
-                except json.JSONDecodeError:
+                    output_data = json_loads(result.stdout)
+                    console.print(json_dumps(output_data, indent=True))
+                except ValueError:
                     console.print(result.stdout)
             else:
                 console.print(result.stdout)
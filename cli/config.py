@@ -1,16 +1,33 @@
 """Configuration management for CADX."""
 
+import functools
 import os
+import re
 from pathlib import Path
 from typing import Dict, List, Optional, Any
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 import yaml
 from dotenv import load_dotenv
 
+# libyaml-backed loader/dumper when the C extension is available; the
+# pure-Python tokenizer is roughly an order of magnitude slower
+try:
+    from yaml import CSafeLoader as _YamlLoader, CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader, SafeDumper as _YamlDumper
+
+# Optional msgspec decode path; its C-level document construction is
+# faster than PyYAML's even on top of the same libyaml tokenizer
+try:
+    import msgspec.yaml as _msgspec_yaml
+except ImportError:
+    _msgspec_yaml = None
+
 load_dotenv()
 
 class AIProvider(BaseModel):
     """AI provider configuration."""
+    model_config = ConfigDict(defer_build=True)
     name: str
     api_key: Optional[str] = None
     base_url: Optional[str] = None
@@ -19,6 +36,7 @@ class AIProvider(BaseModel):
 
 class AndroidConfig(BaseModel):
     """Android development configuration."""
+    model_config = ConfigDict(defer_build=True)
     adb_path: Optional[str] = None
     fastboot_path: Optional[str] = None
     default_device: Optional[str] = None
@@ -26,6 +44,7 @@ class AndroidConfig(BaseModel):
 
 class CodexConfig(BaseModel):
     """Codex CLI integration settings."""
+    model_config = ConfigDict(defer_build=True)
     auto_mode: bool = False
     suggest_mode: bool = True
     quiet_mode: bool = False
@@ -33,33 +52,45 @@ class CodexConfig(BaseModel):
 
 class CIConfig(BaseModel):
     """CI/CD configuration."""
+    model_config = ConfigDict(defer_build=True)
     quiet_mode: bool = True
     json_output: bool = True
     github_token: Optional[str] = None
     webhook_url: Optional[str] = None
 
+# Default provider entries, built once; model_construct keeps the deferred
+# validator untouched at import time
+_DEFAULT_PROVIDERS = [
+    AIProvider.model_construct(
+        name="openai",
+        api_key=os.getenv("OPENAI_API_KEY"),
+        model="gpt-4"
+    ),
+    AIProvider.model_construct(
+        name="openrouter",
+        api_key=os.getenv("OPENROUTER_API_KEY"),
+        base_url="https://openrouter.ai/api/v1",
+        model="anthropic/claude-3.5-sonnet"
+    ),
+    AIProvider.model_construct(
+        name="gemini",
+        api_key=os.getenv("GEMINI_API_KEY"),
+        model="gemini-pro"
+    )
+]
+
 class Config(BaseModel):
     """Main configuration model."""
-    
-    # AI Providers
-    ai_providers: List[AIProvider] = Field(default_factory=lambda: [
-        AIProvider(
-            name="openai",
-            api_key=os.getenv("OPENAI_API_KEY"),
-            model="gpt-4"
-        ),
-        AIProvider(
-            name="openrouter", 
-            api_key=os.getenv("OPENROUTER_API_KEY"),
-            base_url="https://openrouter.ai/api/v1",
-            model="anthropic/claude-3.5-sonnet"
-        ),
-        AIProvider(
-            name="gemini",
-            api_key=os.getenv("GEMINI_API_KEY"),
-            model="gemini-pro"
-        )
-    ])
+
+    # Validator build is deferred to first use; commands that never touch
+    # config skip the pydantic-core schema build at import
+    model_config = ConfigDict(defer_build=True)
+
+    # AI Providers; per-instance copies so callers mutating a provider
+    # never touch the shared defaults
+    ai_providers: List[AIProvider] = Field(
+        default_factory=lambda: [p.model_copy() for p in _DEFAULT_PROVIDERS]
+    )
     
     # Component configurations
     android: AndroidConfig = Field(default_factory=AndroidConfig)
@@ -70,46 +101,205 @@ class Config(BaseModel):
     log_level: str = "INFO"
     output_format: str = "rich"  # rich, json, plain
     cache_dir: Path = Field(default_factory=lambda: Path.home() / ".cadx" / "cache")
-    
+
+    # Name -> provider index, built lazily for O(1) lookups
+    _providers_by_name: Optional[Dict[str, AIProvider]] = PrivateAttr(default=None)
+
+    def provider_by_name(self, name: str) -> Optional[AIProvider]:
+        """Get an AI provider by name via a cached index."""
+        if (self._providers_by_name is None
+                or len(self._providers_by_name) != len(self.ai_providers)):
+            self._providers_by_name = {p.name: p for p in self.ai_providers}
+        return self._providers_by_name.get(name)
+
+
+# Stamped into files we write ourselves; load() may skip re-validation
+# for data carrying the current marker
+_SCHEMA_VERSION = 1
+
+def _construct_config(data: Dict[str, Any]) -> Config:
+    """Rebuild a Config from trusted round-tripped data without validation.
+
+    model_construct skips pydantic-core entirely, so nested models and the
+    Path field are rebuilt explicitly.
+    """
+    return Config.model_construct(
+        ai_providers=[AIProvider.model_construct(**p) for p in data.get("ai_providers", [])],
+        android=AndroidConfig.model_construct(**data.get("android", {})),
+        codex=CodexConfig.model_construct(**data.get("codex", {})),
+        ci=CIConfig.model_construct(**data.get("ci", {})),
+        log_level=data.get("log_level", "INFO"),
+        output_format=data.get("output_format", "rich"),
+        cache_dir=Path(data["cache_dir"]) if "cache_dir" in data else Path.home() / ".cadx" / "cache",
+    )
+
 class ConfigManager:
     """Configuration manager."""
-    
+
     def __init__(self):
         self.config_dir = Path.home() / ".cadx"
         self.config_file = self.config_dir / "config.yaml"
         self.config_dir.mkdir(exist_ok=True)
-        
+        self._cached_key = None
+        self._cached_config = None
+        self._cached_json = None
+
     def load(self) -> Config:
-        """Load configuration from file."""
-        if self.config_file.exists():
+        """Load configuration from file.
+
+        The parsed Config is cached keyed on the file's (mtime, size), so
+        repeat loads in the same process skip the read+parse+validate.
+        """
+        try:
+            st = self.config_file.stat()
+        except OSError:
+            return Config()
+
+        key = (st.st_mtime_ns, st.st_size)
+        if key == self._cached_key:
+            return self._cached_config
+
+        if _msgspec_yaml is not None:
+            data = _msgspec_yaml.decode(self.config_file.read_bytes()) or {}
+        else:
             with open(self.config_file, 'r') as f:
-                data = yaml.safe_load(f)
-                return Config.model_validate(data)
-        return Config()
-    
+                data = yaml.load(f, Loader=_YamlLoader) or {}
+
+        # Files we wrote ourselves carry the schema marker and were
+        # validated at save time; user-edited or legacy files get the
+        # full validation pass
+        if data.pop("_cadx_schema", None) == _SCHEMA_VERSION:
+            config = _construct_config(data)
+        else:
+            config = Config.model_validate(data)
+        self._cached_key = key
+        self._cached_config = config
+        return config
+
+    def dump_json(self) -> str:
+        """Pretty-printed JSON of the current config, cached with the parse.
+
+        Repeat config --show invocations in one process reuse the string
+        instead of re-serializing an unchanged Config.
+        """
+        config = self.load()
+        if self._cached_json is None or config is not self._cached_config:
+            self._cached_json = config.model_dump_json(indent=2)
+        return self._cached_json
+
+    def invalidate(self) -> None:
+        """Drop the cached parse; the next load() re-reads the file."""
+        self._cached_key = None
+        self._cached_config = None
+        self._cached_json = None
+
     def save(self, config: Config) -> None:
         """Save configuration to file."""
+        # mode="json" turns Path and friends into plain scalars the
+        # safe dumper can represent
+        payload = config.model_dump(mode="json")
+        payload["_cadx_schema"] = _SCHEMA_VERSION
         with open(self.config_file, 'w') as f:
-            yaml.dump(config.model_dump(), f, default_flow_style=False)
-            
+            yaml.dump(payload, f, Dumper=_YamlDumper, default_flow_style=False)
+        self.invalidate()
+
+
+    def _load_providers_only(self) -> Optional[List[AIProvider]]:
+        """Parse just the ai_providers subtree for light lookups.
+
+        Slices the ai_providers block out of the raw text and parses only
+        that, skipping the rest of the document. Returns None when the
+        block can't be isolated; callers then fall back to a full load().
+        """
+        try:
+            text = self.config_file.read_text()
+        except OSError:
+            return None
+
+        # Unvalidated model_construct is only safe for files we wrote
+        # ourselves — same policy as load(); hand-edited files without the
+        # marker take the fully validated path instead
+        if not re.search(rf"(?m)^_cadx_schema:\s*{_SCHEMA_VERSION}\s*$", text):
+            return None
+
+        # The block runs from the top-level key to the next top-level key
+        match = re.search(r"(?m)^ai_providers:.*\n(?:(?:[ \t-].*)?\n)*", text)
+        if not match:
+            return None
+
+        try:
+            data = yaml.load(match.group(0), Loader=_YamlLoader)
+        except yaml.YAMLError:
+            return None
+
+        entries = (data or {}).get("ai_providers")
+        if not isinstance(entries, list):
+            return None
+
+        providers = []
+        for entry in entries:
+            if not isinstance(entry, dict) or "name" not in entry:
+                return None
+            providers.append(AIProvider.model_construct(**entry))
+        return providers
+
     def get_provider(self, name: str) -> Optional[AIProvider]:
         """Get AI provider by name."""
+        if self._cached_config is None:
+            # Cold lookup: try the providers-only partial parse first
+            providers = self._load_providers_only()
+            if providers is not None:
+                for provider in providers:
+                    if provider.name == name and provider.enabled:
+                        return provider
+                return None
+
         config = self.load()
-        for provider in config.ai_providers:
-            if provider.name == name and provider.enabled:
-                return provider
+        provider = config.provider_by_name(name)
+        if provider and provider.enabled:
+            return provider
         return None
 
-_config_manager = ConfigManager()
+_config_manager: Optional[ConfigManager] = None
+
+def _get_manager() -> ConfigManager:
+    """Return the shared ConfigManager, constructing it on first use.
+
+    Construction stats the home directory and mkdirs ~/.cadx, so it's
+    deferred until a command actually touches configuration.
+    """
+    global _config_manager
+    if _config_manager is None:
+        _config_manager = ConfigManager()
+    return _config_manager
+
+@functools.lru_cache(maxsize=4)
+def _load_config_cached(config_file: str, mtime_ns: int) -> Config:
+    """Parse the config file; keyed on its mtime so edits invalidate."""
+    return _get_manager().load()
 
 def load_config() -> Config:
-    """Load the current configuration."""
-    return _config_manager.load()
+    """Load the current configuration.
+
+    Repeat calls in the same process skip the stat+read+parse as long as the
+    config file hasn't changed on disk.
+    """
+    manager = _get_manager()
+    try:
+        mtime_ns = os.stat(manager.config_file).st_mtime_ns
+    except OSError:
+        mtime_ns = -1
+    return _load_config_cached(str(manager.config_file), mtime_ns)
 
 def save_config(config: Config) -> None:
     """Save configuration."""
-    _config_manager.save(config)
+    _get_manager().save(config)
+    _load_config_cached.cache_clear()
+
+def dump_config_json() -> str:
+    """Serialized current configuration for display."""
+    return _get_manager().dump_json()
 
 def get_ai_provider(name: str) -> Optional[AIProvider]:
     """Get AI provider configuration."""
-    return _config_manager.get_provider(name)
\ No newline at end of file
+    return _get_manager().get_provider(name)
\ No newline at end of file
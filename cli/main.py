@@ -6,22 +6,24 @@ This is an open source tool for Android development automation
 using Codex CLI, multi-agent pipelines, and various AI providers.
 """
 
+import functools
 import sys
 from pathlib import Path
 from typing import Optional
 
 import typer
-from rich.console import Console
-from rich.panel import Panel
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+# The subcommand modules only pull in typer and cli.commands at import
+# time; rich and pydantic stay out of the cold-start path until a command
+# actually needs them
+from cli.commands import get_console
 from cli.commands.android import android_app
 from cli.commands.agents import agents_app
 from cli.commands.codex import codex_app
 from cli.commands.ci import ci_app
-from cli.config import Config, load_config
 
 app = typer.Typer(
     name="cadx",
@@ -29,8 +31,6 @@ app = typer.Typer(
     add_completion=False,
 )
 
-console = Console()
-
 # Add subcommands
 app.add_typer(android_app, name="android", help="Android development tools (ADB, fastboot, logcat)")
 app.add_typer(agents_app, name="agents", help="AI agents management and multi-provider support")  
@@ -40,7 +40,8 @@ app.add_typer(ci_app, name="ci", help="CI/CD integration and quiet mode")
 @app.command()
 def version():
     """Show version information."""
-    console.print(Panel.fit(
+    from rich.panel import Panel
+    get_console().print(Panel.fit(
         "🤖 Codex-Android-AI-Agent v0.1.0\n"
         "Open source Android dev automation\n"
         "Codex CLI + Multi-agent pipelines",
@@ -53,11 +54,13 @@ def config(
     edit: bool = typer.Option(False, "--edit", help="Edit configuration file"),
 ):
     """Manage configuration."""
-    config_obj = load_config()
-    
+    from cli.config import dump_config_json
+
+    console = get_console()
+
     if show:
         console.print("📝 Current Configuration:")
-        console.print(config_obj.model_dump_json(indent=2))
+        console.print(dump_config_json())
     elif edit:
         config_file = Path.home() / ".cadx" / "config.yaml"
         console.print(f"Edit config file: {config_file}")
@@ -65,18 +68,30 @@ def config(
     else:
         console.print("Use --show or --edit options")
 
-@app.command()  
+@functools.lru_cache(maxsize=1)
+def _adb_tools_available() -> bool:
+    """Probe for adb_shell once per process; the failed-import path walks
+    sys.path on every attempt."""
+    try:
+        import adb_shell  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+@app.command()
 def status():
     """Show system status and diagnostics."""
+    from cli.config import load_config
+
+    console = get_console()
     console.print("🔍 System Status:")
-    
+
     # Check dependencies
-    try:
-        import adb_shell
+    if _adb_tools_available():
         console.print("✅ ADB tools available")
-    except ImportError:
+    else:
         console.print("❌ ADB tools not available")
-        
+
     # Check AI providers
     config_obj = load_config()
     for provider in config_obj.ai_providers:
@@ -90,10 +105,10 @@ def main():
     try:
         app()
     except KeyboardInterrupt:
-        console.print("\n👋 Goodbye!")
+        get_console().print("\n👋 Goodbye!")
         sys.exit(0)
     except Exception as e:
-        console.print(f"❌ Error: {e}")
+        get_console().print(f"❌ Error: {e}")
         sys.exit(1)
 
 if __name__ == "__main__":
@@ -1,8 +1,12 @@
 """Task packs - predefined workflows for common Android development tasks."""
 
+import functools
 import json
+import os
+import threading
 import time
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, Any, List, Optional
 import sys
@@ -25,14 +29,19 @@ class TaskPack:
     
     def add_step(self, name: str, func, **kwargs):
         """Add a step to the task pack."""
-        self.steps.append({
-            "name": name,
-            "function": func,
-            "kwargs": kwargs
-        })
+        # Plain tuples: iteration unpacks by position instead of paying
+        # a dict allocation plus keyed lookups per step
+        self.steps.append((name, func, kwargs))
     
     def execute(self, project_path: Optional[Path] = None) -> Dict[str, Any]:
         """Execute all steps in the task pack."""
+        # Fresh walk cache per run: file-touching steps share tree walks
+        # within one execution but never see a stale list across runs
+        _walk_cache.clear()
+
+        # Wall-clock timestamps for reporting, monotonic clock for the
+        # duration so NTP adjustments can't skew it
+        start_ns = time.perf_counter_ns()
         results = {
             "task_pack": self.name,
             "project_path": str(project_path) if project_path else None,
@@ -42,8 +51,8 @@ class TaskPack:
         }
         
         try:
-            for step in self.steps:
-                step_result = self._execute_step(step, project_path)
+            for name, func, kwargs in self.steps:
+                step_result = self._execute_step(name, func, kwargs, project_path)
                 results["steps"].append(step_result)
                 
                 if not step_result["success"]:
@@ -55,27 +64,29 @@ class TaskPack:
             results["error"] = str(e)
         
         results["end_time"] = time.time()
-        results["duration"] = results["end_time"] - results["start_time"]
-        
+        results["duration"] = (time.perf_counter_ns() - start_ns) / 1e9
+
         return results
     
-    def _execute_step(self, step: Dict[str, Any], project_path: Optional[Path]) -> Dict[str, Any]:
+    def _execute_step(
+        self, name: str, func, kwargs: Dict[str, Any], project_path: Optional[Path]
+    ) -> Dict[str, Any]:
         """Execute a single step."""
+        start_ns = time.perf_counter_ns()
         step_result = {
-            "name": step["name"],
+            "name": name,
             "start_time": time.time(),
             "success": False,
             "output": "",
             "error": ""
         }
-        
+
         try:
-            kwargs = step["kwargs"].copy()
             if project_path and "project_path" not in kwargs:
-                kwargs["project_path"] = project_path
-                
-            output = step["function"](**kwargs)
-            
+                kwargs = {**kwargs, "project_path": project_path}
+
+            output = func(**kwargs)
+
             step_result["success"] = True
             step_result["output"] = output
             
@@ -83,10 +94,34 @@ class TaskPack:
             step_result["error"] = str(e)
         
         step_result["end_time"] = time.time()
-        step_result["duration"] = step_result["end_time"] - step_result["start_time"]
-        
+        step_result["duration"] = (time.perf_counter_ns() - start_ns) / 1e9
+
         return step_result
 
+# Tree-walk results shared by steps within one TaskPack.execute run
+_walk_cache: Dict[Any, List[Path]] = {}
+
+def _walk_with_suffixes(root: Path, suffixes) -> List[Path]:
+    """Collect files matching any of the given suffixes in one tree walk.
+
+    Each rglob pattern re-walks the whole tree; os.walk visits every
+    directory exactly once regardless of how many suffixes are wanted.
+    Results are cached per (root, suffixes) so packs whose steps sweep the
+    same files pay for a single walk per execution.
+    """
+    key = (str(root), frozenset(suffixes))
+    cached = _walk_cache.get(key)
+    if cached is not None:
+        return cached
+
+    matches = []
+    for dirpath, _dirnames, filenames in os.walk(root):
+        for filename in filenames:
+            if os.path.splitext(filename)[1] in suffixes:
+                matches.append(Path(dirpath) / filename)
+    _walk_cache[key] = matches
+    return matches
+
 # Task Pack Implementations
 
 def android_project_setup(project_path: Path) -> str:
@@ -129,8 +164,7 @@ def generate_main_activity(project_path: Path) -> str:
     kotlin_dir = project_path / "app/src/main/kotlin"
     kotlin_dir.mkdir(parents=True, exist_ok=True)
     
-    with open(kotlin_dir / "MainActivity.kt", "w") as f:
-        f.write(activity_code)
+    (kotlin_dir / "MainActivity.kt").write_text(activity_code, encoding="utf-8")
     
     return f"Generated MainActivity.kt in {kotlin_dir}"
 
@@ -158,41 +192,38 @@ def generate_gradle_files(project_path: Path) -> str:
     app_dir = project_path / "app"
     app_dir.mkdir(exist_ok=True)
     
-    with open(app_dir / "build.gradle.kts", "w") as f:
-        f.write(app_gradle)
+    (app_dir / "build.gradle.kts").write_text(app_gradle, encoding="utf-8")
     
     return f"Generated build.gradle.kts in {app_dir}"
 
 def fix_android_code(project_path: Path) -> str:
     """Fix common issues in Android code."""
     fixer = CodeFixer()
-    results = []
-    
-    # Find Kotlin and Java files
-    code_files = []
-    for ext in ["*.kt", "*.java"]:
-        code_files.extend(project_path.rglob(ext))
-    
-    for file_path in code_files[:10]:  # Limit to 10 files
+
+    # One tree walk for both extensions instead of two rglob passes
+    code_files = _walk_with_suffixes(project_path, {".kt", ".java"})
+
+    def _process_one(file_path: Path) -> str:
         try:
-            with open(file_path, 'r') as f:
-                original_code = f.read()
-            
+            original_code = file_path.read_text()
+
             fixed_code = fixer.fix(
-                original_code, 
+                original_code,
                 str(file_path),
                 context={"android_project": True}
             )
-            
-            # Save fixed code
-            with open(file_path, 'w') as f:
-                f.write(fixed_code)
-            
-            results.append(f"Fixed: {file_path.name}")
-            
+
+            file_path.write_text(fixed_code)
+            return f"Fixed: {file_path.name}"
+
         except Exception as e:
-            results.append(f"Error fixing {file_path.name}: {e}")
-    
+            return f"Error fixing {file_path.name}: {e}"
+
+    # Each file is read->fix->write; the pool overlaps disk I/O with the
+    # fixer's provider round trips. map keeps result order deterministic.
+    with ThreadPoolExecutor(max_workers=min(10, (os.cpu_count() or 4) * 2)) as executor:
+        results = list(executor.map(_process_one, code_files[:10]))  # Limit to 10 files
+
     return f"Fixed {len(results)} files: {', '.join(results)}"
 
 def analyze_build_logs(project_path: Path) -> str:
@@ -200,16 +231,18 @@ def analyze_build_logs(project_path: Path) -> str:
     analyzer = LogAnalyzer()
     
     # Look for build logs
-    log_files = list(project_path.rglob("*.log"))
+    log_files = _walk_with_suffixes(project_path, {".log"})
     if not log_files:
         return "No log files found for analysis"
     
     results = []
     for log_file in log_files[:3]:  # Analyze up to 3 log files
         try:
-            with open(log_file, 'r') as f:
-                log_content = f.read()
-            
+            # One bulk read and one decode; build logs can be tens of MB
+            # and the text-mode reader decodes incrementally per chunk
+            log_content = log_file.read_bytes().decode("utf-8", errors="replace")
+
+
             analysis = analyzer.analyze(
                 log_content,
                 log_type="build",
@@ -233,21 +266,46 @@ def run_android_tests(project_path: Path) -> str:
         
         # Make gradlew executable
         gradlew_path.chmod(0o755)
-        
-        # Run tests
-        result = subprocess.run(
+
+        # Only the output tails are reported, so keep a few KB per stream
+        # instead of buffering the whole gradle log in memory
+        def _drain_tail(stream, tail: bytearray, keep: int = 4096):
+            while True:
+                chunk = stream.read(65536)
+                if not chunk:
+                    break
+                tail += chunk
+                if len(tail) > keep:
+                    del tail[:-keep]
+
+        proc = subprocess.Popen(
             [str(gradlew_path), "test"],
             cwd=project_path,
-            capture_output=True,
-            text=True,
-            timeout=300  # 5 minute timeout
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE
         )
-        
-        if result.returncode == 0:
-            return f"Tests passed successfully: {result.stdout[-200:]}"
+
+        out_tail, err_tail = bytearray(), bytearray()
+        readers = [
+            threading.Thread(target=_drain_tail, args=(proc.stdout, out_tail), daemon=True),
+            threading.Thread(target=_drain_tail, args=(proc.stderr, err_tail), daemon=True)
+        ]
+        for reader in readers:
+            reader.start()
+
+        try:
+            returncode = proc.wait(timeout=300)  # 5 minute timeout
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            raise
+        for reader in readers:
+            reader.join()
+
+        if returncode == 0:
+            return f"Tests passed successfully: {out_tail.decode(errors='replace')[-200:]}"
         else:
-            return f"Tests failed: {result.stderr[-200:]}"
-            
+            return f"Tests failed: {err_tail.decode(errors='replace')[-200:]}"
+
     except subprocess.TimeoutExpired:
         return "Tests timed out after 5 minutes"
     except Exception as e:
@@ -280,13 +338,13 @@ Android mobile application
 - Add proper testing coverage
 """
     
-    with open(project_path / "codex.md", "w") as f:
-        f.write(codex_md_content)
+    (project_path / "codex.md").write_text(codex_md_content, encoding="utf-8")
     
     return f"Created codex.md integration file in {project_path}"
 
 # Predefined Task Packs
 
+@functools.lru_cache(maxsize=None)
 def create_android_setup_pack() -> TaskPack:
     """Task pack for setting up new Android project."""
     pack = TaskPack(
@@ -301,6 +359,7 @@ def create_android_setup_pack() -> TaskPack:
     
     return pack
 
+@functools.lru_cache(maxsize=None)
 def create_code_quality_pack() -> TaskPack:
     """Task pack for improving code quality."""
     pack = TaskPack(
@@ -314,6 +373,7 @@ def create_code_quality_pack() -> TaskPack:
     
     return pack
 
+@functools.lru_cache(maxsize=None)
 def create_maintenance_pack() -> TaskPack:
     """Task pack for project maintenance tasks."""
     pack = TaskPack(
@@ -328,6 +388,7 @@ def create_maintenance_pack() -> TaskPack:
     
     return pack
 
+@functools.lru_cache(maxsize=None)
 def create_ci_cd_pack() -> TaskPack:
     """Task pack for CI/CD setup."""
     pack = TaskPack(
@@ -383,8 +444,7 @@ jobs:
       run: ./gradlew assembleDebug
 """
         
-        with open(workflows_dir / "ci.yml", "w") as f:
-            f.write(ci_yml)
+        (workflows_dir / "ci.yml").write_text(ci_yml, encoding="utf-8")
         
         return f"Created GitHub Actions CI workflow in {workflows_dir}"
     
@@ -414,15 +474,16 @@ def list_available_packs() -> List[Dict[str, str]]:
 
 def execute_task_pack(pack_name: str, project_path: Optional[Path] = None) -> Dict[str, Any]:
     """Execute a task pack by name."""
-    if pack_name not in AVAILABLE_TASK_PACKS:
+    # Single dict probe instead of a membership test plus a keyed lookup
+    factory = AVAILABLE_TASK_PACKS.get(pack_name)
+    if factory is None:
         return {
             "success": False,
             "error": f"Task pack '{pack_name}' not found. Available packs: {list(AVAILABLE_TASK_PACKS.keys())}"
         }
-    
+
     try:
-        pack = AVAILABLE_TASK_PACKS[pack_name]()
-        return pack.execute(project_path)
+        return factory().execute(project_path)
     except Exception as e:
         return {
             "success": False,
@@ -459,4 +520,14 @@ if __name__ == "__main__":
         
         print(f"\nExecuting task pack: {pack_name}")
         result = execute_task_pack(pack_name, project_path)
-        print(json.dumps(result, indent=2, default=str))
\ No newline at end of file
+
+        # orjson serializes the result dict considerably faster than the
+        # stdlib encoder when it's installed; fall back otherwise
+        try:
+            import orjson
+            dumped = orjson.dumps(
+                result, option=orjson.OPT_INDENT_2, default=str
+            ).decode()
+        except ImportError:
+            dumped = json.dumps(result, indent=2, default=str)
+        print(dumped)
\ No newline at end of file
@@ -0,0 +1,100 @@
+"""Tests for the adb server protocol client framing."""
+
+import pytest
+from android.adb_client import AdbClient, AdbShellDispatchedError
+
+class FakeSocket:
+    """Socket stand-in that serves recv() from a preloaded buffer."""
+
+    def __init__(self, data: bytes, chunk_size: int = 65536):
+        self._data = data
+        self._chunk_size = chunk_size
+        self.sent = b""
+        self.timeouts = []
+
+    def recv(self, length: int) -> bytes:
+        chunk = self._data[:min(length, self._chunk_size)]
+        self._data = self._data[len(chunk):]
+        return chunk
+
+    def sendall(self, data: bytes) -> None:
+        self.sent += data
+
+    def settimeout(self, timeout) -> None:
+        self.timeouts.append(timeout)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+def _v2_packet(packet_id: int, payload: bytes) -> bytes:
+    return bytes([packet_id]) + len(payload).to_bytes(4, "little") + payload
+
+def test_recv_exact_reassembles_short_reads():
+    """_recv_exact keeps reading until the requested length arrives."""
+    sock = FakeSocket(b"OKAYextra", chunk_size=2)
+    assert AdbClient()._recv_exact(sock, 4) == b"OKAY"
+    assert AdbClient()._recv_exact(sock, 5) == b"extra"
+
+def test_recv_exact_raises_on_eof():
+    """A connection closed mid-read is an error, not truncated data."""
+    sock = FakeSocket(b"OK")
+    with pytest.raises(RuntimeError):
+        AdbClient()._recv_exact(sock, 4)
+
+def test_read_reply_parses_hex_length_prefix():
+    """_read_reply reads the 4-hex-digit length then the payload."""
+    sock = FakeSocket(b"000demulator-5554")
+    assert AdbClient()._read_reply(sock) == "emulator-5554"
+
+def test_send_request_frames_and_checks_status():
+    """_send_request length-prefixes the request and accepts OKAY."""
+    sock = FakeSocket(b"OKAY")
+    AdbClient()._send_request(sock, "host:version")
+    assert sock.sent == b"000chost:version"
+
+def test_send_request_raises_on_fail():
+    """A FAIL status surfaces the server's error message."""
+    sock = FakeSocket(b"FAIL0006no adb")
+    with pytest.raises(RuntimeError, match="no adb"):
+        AdbClient()._send_request(sock, "host:version")
+
+def test_read_shell_v2_demultiplexes_streams():
+    """stdout, stderr and the exit code come back from their packets."""
+    sock = FakeSocket(
+        _v2_packet(1, b"out1")
+        + _v2_packet(2, b"err1")
+        + _v2_packet(1, b"out2")
+        + _v2_packet(3, b"\x07")
+    )
+    assert AdbClient()._read_shell_v2(sock) == ("out1out2", "err1", 7)
+
+def test_read_shell_v2_raises_without_exit_packet():
+    """EOF before the exit packet must not fabricate a result."""
+    sock = FakeSocket(_v2_packet(1, b"partial"))
+    with pytest.raises(RuntimeError):
+        AdbClient()._read_shell_v2(sock)
+
+def test_recv_exact_enforces_deadline():
+    """An expired deadline raises before another recv is attempted."""
+    sock = FakeSocket(b"OKAY")
+    with pytest.raises(TimeoutError):
+        AdbClient()._recv_exact(sock, 4, deadline=0.0)
+
+def test_shell_v2_wraps_post_dispatch_failures(monkeypatch):
+    """Errors after the shell request is acked must not look retryable."""
+    # Transport and shell requests are acked, then the stream dies mid-packet
+    sock = FakeSocket(b"OKAY" + b"OKAY" + _v2_packet(1, b"partial"))
+    monkeypatch.setattr(AdbClient, "_connect", lambda self, timeout=None: sock)
+    with pytest.raises(AdbShellDispatchedError):
+        AdbClient().shell_v2("echo hi")
+
+def test_shell_v2_setup_failures_stay_retryable(monkeypatch):
+    """A rejected transport (command never dispatched) is a plain error."""
+    sock = FakeSocket(b"FAIL0009no device")
+    monkeypatch.setattr(AdbClient, "_connect", lambda self, timeout=None: sock)
+    with pytest.raises(RuntimeError) as excinfo:
+        AdbClient().shell_v2("echo hi")
+    assert not isinstance(excinfo.value, AdbShellDispatchedError)